@@ -1,5 +1,22 @@
 """ComPlexionist - Find missing movies and TV episodes in your Plex library."""
 
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+
 from complexionist._version import __version__
 
 __all__ = ["__version__"]
+
+# Subpackages are imported on first attribute access (PEP 562) so that
+# `import complexionist` stays cheap for the CLI's --help/--version paths.
+_LAZY_SUBMODULES = frozenset({"cache", "config", "gaps", "output", "plex", "tmdb", "tvdb"})
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -16,6 +16,17 @@ from pathlib import Path
 BASE_VERSION = "2.0"
 
 
+def _in_git_checkout(path: Path) -> bool:
+    """Check whether a path is inside a git working tree.
+
+    A cheap stat walk used to avoid spawning git when it cannot succeed.
+    """
+    try:
+        return any((p / ".git").exists() for p in (path, *path.parents))
+    except OSError:
+        return False
+
+
 def _get_commit_count() -> int | None:
     """Get the total number of commits in this package's repository.
 
@@ -24,16 +35,23 @@ def _get_commit_count() -> int | None:
     PyInstaller bundle the extracted temp location is not a repo, so git
     fails and we fall back to None (handled by the caller).
 
+    Installed copies (site-packages, bundles) have no .git above them, so
+    the git subprocess is skipped entirely there.
+
     Returns:
         Commit count, or None if git is unavailable or not in a repo.
     """
+    package_dir = Path(__file__).parent
+    if not _in_git_checkout(package_dir):
+        return None
+
     try:
         result = subprocess.run(
             ["git", "rev-list", "--count", "HEAD"],
             capture_output=True,
             text=True,
             timeout=5,
-            cwd=Path(__file__).parent,
+            cwd=package_dir,
         )
         if result.returncode == 0:
             return int(result.stdout.strip())
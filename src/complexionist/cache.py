@@ -306,6 +306,9 @@ class Cache:
         Call this at the end of operations to ensure all cached data is persisted.
         Safe to call even if there are no pending changes.
         """
+        # Fast path for warm scans: nothing to write, so skip the lock entirely
+        if self._dirty_count == 0:
+            return
         with self._lock:
             if self._dirty_count > 0:
                 self._save()
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import functools
+import importlib
 import sys
-from collections.abc import Callable
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -13,21 +18,19 @@ import click
 # Heavy modules (pydantic, httpx, plexapi) are loaded lazily after banner shows
 from rich.console import Console
 from rich.panel import Panel
+from rich.prompt import Confirm, Prompt
 from rich.text import Text
 
-from complexionist import __version__
+from complexionist._version import __version__
 from complexionist.constants import PLEX_YELLOW
 
 console = Console()
+# Errors and progress go to stderr so json/csv on stdout stay parseable
+err_console = Console(stderr=True)
 
-# Track if heavy modules have been loaded
-_modules_loaded = False
 
-
-def _show_splash() -> None:
-    """Display the application splash banner."""
-    # ASCII art banner (no trailing whitespace)
-    banner = r"""
+# ASCII art banner (no trailing whitespace)
+_BANNER = r"""
    _____                _____  _           _             _     _
   / ____|              |  __ \| |         (_)           (_)   | |
  | |     ___  _ __ ___ | |__) | | _____  ___  ___  _ __  _ ___| |_
@@ -36,12 +39,19 @@ def _show_splash() -> None:
   \_____\___/|_| |_| |_|_|    |_|\___/_/\_\_|\___/|_| |_|_|___/\__|
 
   """
+_TAGLINE = " Completing your Plex Media Server libraries"
+# Unstyled splash for redirected output (pipes, CI logs), skipping Rich rendering
+_SPLASH_PLAIN = f"{_BANNER.rstrip()}\n\n{_TAGLINE}  v{__version__}\n"
+
 
+@functools.cache
+def _build_splash_panel() -> Panel:
+    """Build the splash banner panel (static, so built at most once)."""
     # Create styled banner text
-    banner_text = Text(banner, style=f"bold {PLEX_YELLOW}")
+    banner_text = Text(_BANNER, style=f"bold {PLEX_YELLOW}")
 
     # Tagline and version
-    tagline = Text(" Completing your Plex Media Server libraries", style="dim")
+    tagline = Text(_TAGLINE, style="dim")
     version = Text(f"v{__version__}", style="dim")
 
     # Build the panel content
@@ -52,31 +62,78 @@ def _show_splash() -> None:
     content.append("  ")
     content.append_text(version)
 
-    panel = Panel(
+    return Panel(
         content,
         border_style=PLEX_YELLOW,
         padding=(0, 2),
     )
-    console.print(panel)
 
 
-def _load_modules() -> None:
-    """Load heavy modules after banner is displayed.
+def _status_console(format: str) -> Console:
+    """Console for the splash and status messages of a scan.
 
-    Shows a 'Starting up...' message while loading pydantic, httpx, plexapi, etc.
+    Text output keeps them on stdout; json/csv move them to stderr so stdout
+    carries only the report.
     """
-    global _modules_loaded
-    if _modules_loaded:
+    return console if format == "text" else err_console
+
+
+def _show_splash(out: Console = console) -> None:
+    """Display the application splash banner."""
+    if not out.is_terminal:
+        out.file.write(_SPLASH_PLAIN)
         return
+    out.print(_build_splash_panel())
+
+
+# Modules a scan needs; imported in the background while the splash renders
+_PREFETCH_MODULES = (
+    "complexionist.config",
+    "complexionist.output",
+    "complexionist.plex",
+    "complexionist.tmdb",
+    "complexionist.tvdb",
+    "rich.progress",
+)
+_prefetch_thread: threading.Thread | None = None
+_prefetch_lock = threading.Lock()
+
+
+def _prefetch_modules() -> None:
+    """Import the heavy scan modules (pydantic, httpx, plexapi) ahead of use."""
+    for name in _PREFETCH_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            # The command's own import will raise it with a proper traceback
+            return
+
+
+def _start_prefetch() -> None:
+    """Start importing heavy modules on a background thread (once per process)."""
+    global _prefetch_thread
+    with _prefetch_lock:
+        if _prefetch_thread is None:
+            _prefetch_thread = threading.Thread(
+                target=_prefetch_modules, name="complexionist-prefetch", daemon=True
+            )
+            _prefetch_thread.start()
 
-    from rich.status import Status
 
-    with Status("[dim]Starting up...[/dim]", console=console, spinner="dots"):
-        # Import heavy modules to warm them up
-        # These imports trigger pydantic model compilation, httpx setup, etc.
-        from complexionist import config, output, plex, tmdb, tvdb  # noqa: F401
+def _finish_prefetch() -> None:
+    """Wait for the background prefetch so imports never race across threads."""
+    if _prefetch_thread is not None:
+        _prefetch_thread.join()
 
-    _modules_loaded = True
+
+def _ensure_startup(ctx: click.Context, format: str = "text") -> None:
+    """Show the splash once per invocation while heavy modules load behind it."""
+    if not ctx.obj.get("_skip_splash"):
+        _start_prefetch()
+        _show_splash(_status_console(format))
+        # Mark splash as shown so nested commands don't show it again
+        ctx.obj["_skip_splash"] = True
+    _finish_prefetch()
 
 
 class BannerGroup(click.Group):
@@ -101,20 +158,21 @@ class BannerCommand(click.Command):
 
 def _show_help_hints() -> None:
     """Display helpful hints for getting started."""
-    console.print()
-    console.print("[bold]Quick Start:[/bold]")
-    console.print(
-        f"  [{PLEX_YELLOW}]complexionist movies[/]     Find missing movies in collections"
-    )
-    console.print(f"  [{PLEX_YELLOW}]complexionist tv[/]         Find missing TV episodes")
-    console.print(f"  [{PLEX_YELLOW}]complexionist scan[/]       Scan both libraries")
-    console.print()
-    console.print("[bold]Configuration:[/bold]")
-    console.print(f"  [{PLEX_YELLOW}]complexionist config setup[/]     Run setup wizard")
-    console.print(f"  [{PLEX_YELLOW}]complexionist config show[/]      Show current config")
-    console.print()
-    console.print("[dim]Use --help with any command for more options.[/dim]")
-    console.print()
+    lines = [
+        "",
+        "[bold]Quick Start:[/bold]",
+        f"  [{PLEX_YELLOW}]complexionist movies[/]     Find missing movies in collections",
+        f"  [{PLEX_YELLOW}]complexionist tv[/]         Find missing TV episodes",
+        f"  [{PLEX_YELLOW}]complexionist scan[/]       Scan both libraries",
+        "",
+        "[bold]Configuration:[/bold]",
+        f"  [{PLEX_YELLOW}]complexionist config setup[/]     Run setup wizard",
+        f"  [{PLEX_YELLOW}]complexionist config show[/]      Show current config",
+        "",
+        "[dim]Use --help with any command for more options.[/dim]",
+        "",
+    ]
+    console.print("\n".join(lines))
 
 
 def _has_valid_config() -> bool:
@@ -130,19 +188,21 @@ def _has_valid_config() -> bool:
 
 def _run_interactive_start(ctx: click.Context) -> None:
     """Run interactive mode selection when config is valid."""
-    from rich.prompt import Prompt
-
-    console.print()
-    console.print("[bold]What would you like to scan?[/bold]")
-    console.print()
-    console.print(f"  [{PLEX_YELLOW}]M[/] - Movies (find missing collection movies)")
-    console.print(f"  [{PLEX_YELLOW}]T[/] - TV Shows (find missing episodes)")
-    console.print(f"  [{PLEX_YELLOW}]B[/] - Both")
-    console.print()
+    lines = [
+        "",
+        "[bold]What would you like to scan?[/bold]",
+        "",
+        f"  [{PLEX_YELLOW}]M[/] - Movies (find missing collection movies)",
+        f"  [{PLEX_YELLOW}]T[/] - TV Shows (find missing episodes)",
+        f"  [{PLEX_YELLOW}]B[/] - Both",
+        "",
+    ]
+    console.print("\n".join(lines))
 
     choice = Prompt.ask(
         "Select",
-        choices=["m", "t", "b", "M", "T", "B"],
+        choices=["M", "T", "B"],
+        case_sensitive=False,
         default="M",
         show_choices=False,
     )
@@ -166,19 +226,10 @@ def _handle_no_args(ctx: click.Context) -> None:
     - Offers interactive M/T/B prompt if config is valid
     - Shows help hints otherwise
     """
-    from rich.prompt import Confirm
+    _ensure_startup(ctx)
 
     from complexionist.setup import detect_first_run, run_setup_wizard
 
-    # Always show splash banner
-    _show_splash()
-
-    # Load heavy modules with "Starting up..." indicator
-    _load_modules()
-
-    # Mark splash as shown so subcommands don't show it again
-    ctx.obj["_skip_splash"] = True
-
     # Check if this is first run (no config)
     if detect_first_run():
         console.print()
@@ -218,7 +269,7 @@ def _handle_no_args(ctx: click.Context) -> None:
 
 
 def _save_example_ini(path: Path) -> None:
-    """Save an example INI configuration file.
+    """Save an example INI configuration file (atomically).
 
     Args:
         path: Path to save the example file.
@@ -268,8 +319,13 @@ min_owned = 2
 ; Comma-separated list of collections to skip
 ; collections = Anthology Collection
 """
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(example_content)
+    # Write-then-rename so an interrupted write never leaves a partial file
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        tmp_path.write_text(example_content, encoding="utf-8")
+        tmp_path.replace(path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
 def _scan_context(library_name: str, server: str | None) -> str:
@@ -295,11 +351,12 @@ def _scan_context(library_name: str, server: str | None) -> str:
     return f"library '{library_name}'"
 
 
-def _resolve_server(server: str | None) -> tuple[str | None, str | None]:
+def _resolve_server(server: str | None, out: Console = console) -> tuple[str | None, str | None]:
     """Resolve a --server argument to (url, token).
 
     Args:
         server: Server name or index string, or None for default.
+        out: Console for the "Using server" status line.
 
     Returns:
         Tuple of (url, token) or (None, None) for default.
@@ -313,7 +370,7 @@ def _resolve_server(server: str | None) -> tuple[str | None, str | None]:
     servers = cfg.plex.servers
 
     if not servers:
-        console.print("[red]No Plex servers configured.[/red]")
+        err_console.print("[red]No Plex servers configured.[/red]")
         sys.exit(1)
 
     # Try as index first
@@ -321,9 +378,9 @@ def _resolve_server(server: str | None) -> tuple[str | None, str | None]:
         idx = int(server)
         if 0 <= idx < len(servers):
             s = servers[idx]
-            console.print(f"[dim]Using server: {s.name or f'Server {idx}'}[/dim]")
+            out.print(f"[dim]Using server: {s.name or f'Server {idx}'}[/dim]")
             return s.url, s.token
-        console.print(f"[red]Server index {idx} out of range (0-{len(servers) - 1})[/red]")
+        err_console.print(f"[red]Server index {idx} out of range (0-{len(servers) - 1})[/red]")
         sys.exit(1)
     except ValueError:
         pass
@@ -331,17 +388,66 @@ def _resolve_server(server: str | None) -> tuple[str | None, str | None]:
     # Try as name (case-insensitive)
     for s in servers:
         if s.name.lower() == server.lower():
-            console.print(f"[dim]Using server: {s.name}[/dim]")
+            out.print(f"[dim]Using server: {s.name}[/dim]")
             return s.url, s.token
 
     # Not found
-    console.print(f"[red]Server not found:[/red] {server}")
-    console.print("[dim]Available servers:[/dim]")
+    err_console.print(f"[red]Server not found:[/red] {server}")
+    err_console.print("[dim]Available servers:[/dim]")
     for i, s in enumerate(servers):
-        console.print(f"  [{i}] {s.name or '(unnamed)'}")
+        err_console.print(f"  [{i}] {s.name or '(unnamed)'}")
     sys.exit(1)
 
 
+def _connect_plex(server: str | None, out: Console = console) -> Any:
+    """Resolve a --server argument and connect to that Plex server.
+
+    Exits with an error message if the connection fails.
+
+    Args:
+        server: Server name or index string, or None for default.
+        out: Console for status messages.
+
+    Returns:
+        Connected PlexClient instance.
+    """
+    from complexionist.plex import PlexClient, PlexError
+
+    server_url, server_token = _resolve_server(server, out)
+    try:
+        if server_url and server_token:
+            plex = PlexClient(url=server_url, token=server_token)
+        else:
+            plex = PlexClient()
+        plex.connect()
+    except PlexError as e:
+        err_console.print(f"[red]Plex error:[/red] {e}")
+        sys.exit(1)
+    return plex
+
+
+def _connect_api(factory: Callable[[], Any], error_type: type[Exception], label: str) -> Any:
+    """Create a metadata API client and verify its credentials.
+
+    Exits with an error message if the connection test fails.
+
+    Args:
+        factory: Callable returning the client (e.g. TMDBClient).
+        error_type: The client's base exception type.
+        label: Service name for the error message (e.g. "TMDB").
+
+    Returns:
+        Client instance whose test_connection() succeeded.
+    """
+    try:
+        client = factory()
+        client.test_connection()
+    except error_type as e:
+        err_console.print(f"[red]{label} error:[/red] {e}")
+        sys.exit(1)
+    return client
+
+
 def _check_config_exists() -> None:
     """Check if configuration exists, offer setup wizard if not.
 
@@ -354,17 +460,18 @@ def _check_config_exists() -> None:
         sys.exit(0)
 
 
-def _list_libraries(libraries: list[Any], lib_type: str) -> None:
+def _list_libraries(libraries: list[Any], lib_type: str, out: Console = console) -> None:
     """Display available libraries as a table.
 
     Args:
         libraries: List of PlexLibrary objects.
         lib_type: Type description (e.g., "movie", "TV").
+        out: Console to print to.
     """
     from rich.table import Table
 
-    console.print(f"[bold]Available {lib_type} libraries:[/bold]")
-    console.print()
+    out.print(f"[bold]Available {lib_type} libraries:[/bold]")
+    out.print()
 
     table = Table(show_header=True, header_style="bold", box=None, padding=(0, 2))
     table.add_column("#", style="dim", justify="right")
@@ -374,69 +481,115 @@ def _list_libraries(libraries: list[Any], lib_type: str) -> None:
     for i, lib in enumerate(libraries, 1):
         table.add_row(str(i), lib.title, lib.type)
 
-    console.print(table)
-    console.print()
-    console.print("[dim]Use --library to specify which library to scan.[/dim]")
-    console.print('[dim]Example: complexionist movies --library "Movies"[/dim]')
+    out.print(table)
+    out.print()
+    out.print("[dim]Use --library to specify which library to scan.[/dim]")
+    out.print('[dim]Example: complexionist movies --library "Movies"[/dim]')
 
 
-def _create_progress_updater(
-    progress_ctx: Any, progress_task: Any
-) -> Callable[[str, int, int], None]:
-    """Create a progress callback function for gap finders.
+# Minimum seconds between progress bar updates within the same stage
+_PROGRESS_MIN_INTERVAL = 0.05
 
-    Args:
-        progress_ctx: Rich Progress context.
-        progress_task: Progress task ID.
 
-    Returns:
-        Callback function with signature (stage: str, current: int, total: int).
-    """
+@contextmanager
+def _scan_progress(quiet: bool) -> Iterator[Callable[[str, int, int], None] | None]:
+    """Show a progress bar for the duration of a library scan.
+
+    Progress is also skipped when stderr is not a terminal (pipes, CI logs),
+    where the live display would only add a render thread and escape codes.
 
-    def callback(stage: str, current: int, total: int) -> None:
-        if progress_ctx is not None and progress_task is not None:
-            progress_ctx.update(progress_task, description=stage, completed=current, total=total)
+    Args:
+        quiet: If True, no progress is shown and None is yielded.
 
-    return callback
+    Yields:
+        Callback with signature (stage: str, current: int, total: int),
+        or None when progress is not shown.
+    """
+    if quiet or not err_console.is_terminal:
+        yield None
+        return
 
+    # Deferred (usually already loaded by the prefetch) to keep --help fast
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+    )
 
-def _select_library_interactive(libraries: list[Any], lib_type: str) -> str | None:
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=err_console,
+        transient=False,
+    ) as progress:
+        task = progress.add_task("Scanning...", total=None)
+        last_stage = ""
+        last_update = 0.0
+
+        def update(stage: str, current: int, total: int) -> None:
+            # Finders report per item; coalesce bursts but always show
+            # stage changes and completion.
+            nonlocal last_stage, last_update
+            now = time.monotonic()
+            if (
+                stage == last_stage
+                and current < total
+                and now - last_update < _PROGRESS_MIN_INTERVAL
+            ):
+                return
+            last_stage = stage
+            last_update = now
+            progress.update(task, description=stage, completed=current, total=total)
+
+        yield update
+
+
+def _select_library_interactive(
+    libraries: list[Any], lib_type: str, out: Console = console
+) -> str | None:
     """Interactively prompt user to select a library.
 
     Args:
         libraries: List of PlexLibrary objects.
         lib_type: Type description (e.g., "movie", "TV").
+        out: Console for the menu and prompt.
 
     Returns:
         Selected library name, or None if cancelled.
     """
-    from rich.prompt import Prompt
-
-    console.print(f"[bold]Multiple {lib_type} libraries found. Please select one:[/bold]")
-    console.print()
+    out.print(f"[bold]Multiple {lib_type} libraries found. Please select one:[/bold]")
+    out.print()
 
     for i, lib in enumerate(libraries, 1):
-        console.print(f"  [cyan]{i}[/cyan]. {lib.title}")
+        out.print(f"  [cyan]{i}[/cyan]. {lib.title}")
 
-    console.print()
+    out.print()
+
+    # Lower-cased titles let users type a library name instead of its number
+    names: dict[str, str] = {lib.title.lower(): lib.title for lib in libraries}
 
     while True:
         choice = Prompt.ask(
             f"Enter number (1-{len(libraries)})",
             default="1",
+            console=out,
         )
 
         try:
             idx = int(choice)
             if 1 <= idx <= len(libraries):
                 return str(libraries[idx - 1].title)
-            console.print(f"[red]Please enter a number between 1 and {len(libraries)}[/red]")
+            out.print(f"[red]Please enter a number between 1 and {len(libraries)}[/red]")
         except ValueError:
             # Check if they typed a library name directly
-            names: dict[str, str] = {lib.title.lower(): lib.title for lib in libraries}
-            if choice.lower() in names:
-                return names[choice.lower()]
-            console.print("[red]Please enter a valid number or library name[/red]")
+            name = names.get(choice.lower())
+            if name is not None:
+                return name
+            out.print("[red]Please enter a valid number or library name[/red]")
 
 
 def _resolve_libraries(
@@ -444,6 +597,7 @@ def _resolve_libraries(
     requested: tuple[str, ...],
     get_libraries_fn: Callable[[], list[Any]],
     lib_type: str,
+    out: Console = console,
 ) -> list[str] | None:
     """Resolve library names from user input.
 
@@ -452,6 +606,7 @@ def _resolve_libraries(
         requested: Tuple of requested library names (can be empty).
         get_libraries_fn: Function to get available libraries (e.g., plex.get_movie_libraries).
         lib_type: Type description for error messages (e.g., "movie", "TV").
+        out: Console for the library listing and selection prompt.
 
     Returns:
         List of library names to scan, or None if should exit (listed libraries).
@@ -459,7 +614,7 @@ def _resolve_libraries(
     available = get_libraries_fn()
 
     if not available:
-        console.print(f"[yellow]No {lib_type} libraries found on this Plex server.[/yellow]")
+        out.print(f"[yellow]No {lib_type} libraries found on this Plex server.[/yellow]")
         return None
 
     # If no library specified, handle based on count
@@ -469,24 +624,147 @@ def _resolve_libraries(
             return [available[0].title]
         else:
             # Multiple libraries - prompt for selection
-            selected = _select_library_interactive(available, lib_type)
+            selected = _select_library_interactive(available, lib_type, out)
             if selected is None:
                 return None
             return [selected]
 
-    # Validate requested libraries
+    # Validate requested libraries, reporting every unknown name at once
     available_names = {lib.title for lib in available}
-    library_names = []
+    missing = [name for name in requested if name not in available_names]
 
-    for name in requested:
-        if name not in available_names:
-            console.print(f"[red]Library not found:[/red] {name}")
-            console.print()
-            _list_libraries(available, lib_type)
-            return None
-        library_names.append(name)
+    if missing:
+        for name in missing:
+            err_console.print(f"[red]Library not found:[/red] {name}")
+        out.print()
+        _list_libraries(available, lib_type, out)
+        return None
 
-    return library_names
+    return list(requested)
+
+
+# Options shared by the movies, tv and scan commands
+_FORMAT_CHOICE = click.Choice(["text", "json", "csv"])
+
+_format_option = click.option(
+    "--format",
+    "-f",
+    type=_FORMAT_CHOICE,
+    default="text",
+    help="Output format",
+)
+
+_server_option = click.option(
+    "--server",
+    "-s",
+    default=None,
+    help="Plex server name or index (default: first configured server)",
+)
+
+
+def _run_scan(
+    ctx: click.Context,
+    *,
+    library: tuple[str, ...],
+    server: str | None,
+    lib_type: str,
+    get_libraries: Callable[[Any], list[Any]],
+    connect_api: Callable[[Any], Any],
+    make_finder: Callable[[Any, Any, str, Callable[..., None] | None], Any],
+    formatter_cls: Callable[[Any], Any],
+    has_gaps: Callable[[Any], bool],
+    format: str,
+    no_csv: bool,
+) -> None:
+    """Run a gap scan over one or more libraries and output each report.
+
+    Shared by the movies and tv commands: connects to Plex and the metadata
+    API, resolves libraries, runs the finder per library and writes the
+    report in the requested format.
+
+    Args:
+        ctx: Click context (carries quiet flag and scan's shared clients).
+        library: Requested library names (may be empty).
+        server: --server option value.
+        lib_type: Library type for messages (e.g., "movie", "TV").
+        get_libraries: Returns the available libraries for a PlexClient.
+        connect_api: Builds the connected metadata client from the cache.
+        make_finder: Builds a gap finder for (plex, api, library, progress).
+        formatter_cls: Report formatter class.
+        has_gaps: Whether a report has anything worth saving as CSV.
+        format: Output format ("text", "json" or "csv").
+        no_csv: Skip the automatic CSV file in text mode.
+    """
+    from complexionist.cache import Cache
+    from complexionist.statistics import ScanStatistics
+
+    quiet = ctx.obj.get("quiet", False)
+    out = _status_console(format)
+
+    # Create cache (shared with the other subcommand when run from scan)
+    cache = ctx.obj.get("_cache")
+    if cache is None:
+        cache = Cache()
+
+    try:
+        # Connect to Plex (scan passes in an already-connected client)
+        plex = ctx.obj.get("_plex")
+        if plex is None:
+            plex = _connect_plex(server, out)
+
+        # Resolve library names
+        library_names = _resolve_libraries(
+            plex, library, lambda: get_libraries(plex), lib_type, out
+        )
+        if library_names is None:
+            # Either listed libraries or no libraries found
+            return
+
+        api = connect_api(cache)
+
+        # Scan each library
+        for lib_name in library_names:
+            if len(library_names) > 1:
+                out.print(f"\n[bold blue]Scanning library: {lib_name}[/bold blue]")
+
+            # Start statistics tracking
+            stats = ScanStatistics()
+            stats.start()
+
+            # JSON/CSV are for machines: keep stdout free of progress output.
+            # The bar is per library because text output prompts between them.
+            with _scan_progress(quiet or format != "text") as progress_callback:
+                finder = make_finder(plex, api, lib_name, progress_callback)
+                report = finder.find_gaps(lib_name)
+
+            # Stop statistics tracking
+            stats.stop()
+
+            # Output results using formatter
+            formatter = formatter_cls(report)
+            if format == "json":
+                # Write the encoded report as-is; console.print_json would
+                # re-encode it with the stdlib json module.
+                sys.stdout.write(formatter.to_json() + "\n")
+            elif format == "csv":
+                formatter.write_csv(sys.stdout, lineterminator="\n")
+            else:
+                # Save CSV first (unless --no-csv)
+                csv_path = None
+                if not no_csv and has_gaps(report):
+                    csv_path = formatter.save_csv()
+
+                # Show summary with option to view details
+                formatter.show_summary(stats, csv_path)
+
+        # Flush any pending cache writes
+        cache.flush()
+
+    except KeyboardInterrupt:
+        # Still flush cache on interrupt to preserve progress
+        cache.flush()
+        err_console.print("\n[yellow]Scan cancelled.[/yellow]")
+        sys.exit(130)
 
 
 @click.group(cls=BannerGroup, invoke_without_command=True)
@@ -515,7 +793,8 @@ def main(ctx: click.Context, verbose: bool, quiet: bool, cli: bool, gui: bool, w
         _handle_no_args(ctx)
         return
 
-    # Default behavior (no flags) or explicit --gui/--web = GUI mode
+    # Default behavior (no flags) or explicit --gui/--web = GUI mode.
+    # No splash or config work here: the GUI loads config itself when needed.
     from complexionist.gui import run_app
 
     run_app(web_mode=web)
@@ -528,12 +807,7 @@ def main(ctx: click.Context, verbose: bool, quiet: bool, cli: bool, gui: bool, w
     multiple=True,
     help="Movie library name(s) to scan (can specify multiple)",
 )
-@click.option(
-    "--server",
-    "-s",
-    default=None,
-    help="Plex server name or index (default: first configured server)",
-)
+@_server_option
 @click.option("--include-future", is_flag=True, help="Include unreleased movies")
 @click.option(
     "--min-collection-size",
@@ -547,13 +821,7 @@ def main(ctx: click.Context, verbose: bool, quiet: bool, cli: bool, gui: bool, w
     default=None,
     help="Minimum owned movies to report collection gaps (default: from config or 2)",
 )
-@click.option(
-    "--format",
-    "-f",
-    type=click.Choice(["text", "json", "csv"]),
-    default="text",
-    help="Output format",
-)
+@_format_option
 @click.option(
     "--no-csv",
     is_flag=True,
@@ -587,18 +855,12 @@ def movies(
     If no --library is specified, lists available movie libraries.
     """
     # Show splash banner immediately (unless called from scan command)
-    if not ctx.obj.get("_skip_splash"):
-        _show_splash()
-        # Load heavy modules with "Starting up..." indicator
-        _load_modules()
+    _ensure_startup(ctx, format)
 
-    # Now import the modules we need (they're already loaded/cached)
-    from complexionist.cache import Cache
+    # Deferred imports: only the modules this command needs are loaded
     from complexionist.config import get_config
     from complexionist.gaps import MovieGapFinder
     from complexionist.output import MovieReportFormatter
-    from complexionist.plex import PlexClient, PlexError
-    from complexionist.statistics import ScanStatistics
     from complexionist.tmdb import TMDBClient, TMDBError
 
     # Check for first-run (offers setup wizard if no config)
@@ -611,132 +873,46 @@ def movies(
         validate_config()
         return
 
-    quiet = ctx.obj.get("quiet", False)
     cfg = get_config()
 
-    # Use CLI option or config default
+    # Use CLI option or config default. Resolved here, after the first-run
+    # check, so a config written by the setup wizard is the one used.
     if min_collection_size is None:
         min_collection_size = cfg.options.min_collection_size
     if min_owned is None:
         min_owned = cfg.options.min_owned
 
-    # Create cache
-    cache = Cache()
-
-    try:
-        # Resolve server and connect to Plex
-        server_url, server_token = _resolve_server(server)
-        try:
-            if server_url and server_token:
-                plex = PlexClient(url=server_url, token=server_token)
-            else:
-                plex = PlexClient()
-            plex.connect()
-        except PlexError as e:
-            console.print(f"[red]Plex error:[/red] {e}")
-            sys.exit(1)
-
-        # Resolve library names
-        library_names = _resolve_libraries(plex, library, plex.get_movie_libraries, "movie")
-        if library_names is None:
-            # Either listed libraries or no libraries found
-            return
-
-        # Connect to TMDB
-        try:
-            tmdb = TMDBClient(cache=cache)
-            tmdb.test_connection()
-        except TMDBError as e:
-            console.print(f"[red]TMDB error:[/red] {e}")
-            sys.exit(1)
-
-        # Scan each library
-        for lib_name in library_names:
-            if len(library_names) > 1:
-                console.print(f"\n[bold blue]Scanning library: {lib_name}[/bold blue]")
-
-            # Start statistics tracking
-            stats = ScanStatistics()
-            stats.start()
-
-            # Get ignored collection IDs if --use-ignore-list flag is set
-            ignored_collection_ids = cfg.tmdb.ignored_collections if use_ignore_list else None
-
-            if quiet:
-                # Quiet mode: no progress indicators
-                finder = MovieGapFinder(
-                    plex_client=plex,
-                    tmdb_client=tmdb,
-                    include_future=include_future,
-                    min_collection_size=min_collection_size,
-                    min_owned=min_owned,
-                    excluded_collections=cfg.exclusions.collections,
-                    ignored_collection_ids=ignored_collection_ids,
-                    context=_scan_context(lib_name, server),
-                )
-                report = finder.find_gaps(lib_name)
-            else:
-                # Normal mode with progress
-                from rich.progress import (
-                    BarColumn,
-                    Progress,
-                    SpinnerColumn,
-                    TaskProgressColumn,
-                    TextColumn,
-                )
-
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    TaskProgressColumn(),
-                    console=console,
-                    transient=False,
-                ) as progress:
-                    task = progress.add_task("Scanning...", total=None)
-                    progress_callback = _create_progress_updater(progress, task)
-
-                    # Find gaps
-                    finder = MovieGapFinder(
-                        plex_client=plex,
-                        tmdb_client=tmdb,
-                        include_future=include_future,
-                        min_collection_size=min_collection_size,
-                        min_owned=min_owned,
-                        excluded_collections=cfg.exclusions.collections,
-                        ignored_collection_ids=ignored_collection_ids,
-                        progress_callback=progress_callback,
-                        context=_scan_context(lib_name, server),
-                    )
-
-                    report = finder.find_gaps(lib_name)
-
-            # Stop statistics tracking
-            stats.stop()
-
-            # Output results using formatter
-            formatter = MovieReportFormatter(report)
-            if format == "json":
-                console.print_json(formatter.to_json())
-            elif format == "csv":
-                console.print(formatter.to_csv())
-            else:
-                # Save CSV first (unless --no-csv)
-                csv_path = None
-                if not no_csv and report.collections_with_gaps:
-                    csv_path = formatter.save_csv()
-
-                # Show summary with option to view details
-                formatter.show_summary(stats, csv_path)
-
-        # Flush any pending cache writes
-        cache.flush()
+    # Get ignored collection IDs if --use-ignore-list flag is set
+    ignored_collection_ids = cfg.tmdb.ignored_collections if use_ignore_list else None
+
+    def make_finder(
+        plex: Any, tmdb: Any, lib_name: str, progress_callback: Callable[..., None] | None
+    ) -> MovieGapFinder:
+        return MovieGapFinder(
+            plex_client=plex,
+            tmdb_client=tmdb,
+            include_future=include_future,
+            min_collection_size=min_collection_size,
+            min_owned=min_owned,
+            excluded_collections=cfg.exclusions.collections,
+            ignored_collection_ids=ignored_collection_ids,
+            progress_callback=progress_callback,
+            context=_scan_context(lib_name, server),
+        )
 
-    except KeyboardInterrupt:
-        # Still flush cache on interrupt to preserve progress
-        cache.flush()
-        console.print("\n[yellow]Scan cancelled.[/yellow]")
-        sys.exit(130)
+    _run_scan(
+        ctx,
+        library=library,
+        server=server,
+        lib_type="movie",
+        get_libraries=lambda plex: plex.get_movie_libraries(),
+        connect_api=lambda cache: _connect_api(lambda: TMDBClient(cache=cache), TMDBError, "TMDB"),
+        make_finder=make_finder,
+        formatter_cls=MovieReportFormatter,
+        has_gaps=lambda report: bool(report.collections_with_gaps),
+        format=format,
+        no_csv=no_csv,
+    )
 
 
 @main.command(cls=BannerCommand)
@@ -746,12 +922,7 @@ def movies(
     multiple=True,
     help="TV library name(s) to scan (can specify multiple)",
 )
-@click.option(
-    "--server",
-    "-s",
-    default=None,
-    help="Plex server name or index (default: first configured server)",
-)
+@_server_option
 @click.option("--include-future", is_flag=True, help="Include unaired episodes")
 @click.option("--include-specials", is_flag=True, help="Include Season 0 (specials)")
 @click.option(
@@ -765,13 +936,7 @@ def movies(
     multiple=True,
     help="Show title to exclude (can be used multiple times)",
 )
-@click.option(
-    "--format",
-    "-f",
-    type=click.Choice(["text", "json", "csv"]),
-    default="text",
-    help="Output format",
-)
+@_format_option
 @click.option(
     "--no-csv",
     is_flag=True,
@@ -806,18 +971,12 @@ def tv(
     If no --library is specified, lists available TV libraries.
     """
     # Show splash banner immediately (unless called from scan command)
-    if not ctx.obj.get("_skip_splash"):
-        _show_splash()
-        # Load heavy modules with "Starting up..." indicator
-        _load_modules()
+    _ensure_startup(ctx, format)
 
-    # Now import the modules we need (they're already loaded/cached)
-    from complexionist.cache import Cache
+    # Deferred imports: only the modules this command needs are loaded
     from complexionist.config import get_config
     from complexionist.gaps import EpisodeGapFinder
     from complexionist.output import TVReportFormatter
-    from complexionist.plex import PlexClient, PlexError
-    from complexionist.statistics import ScanStatistics
     from complexionist.tvdb import TVDBClient, TVDBError
 
     # Check for first-run (offers setup wizard if no config)
@@ -830,133 +989,46 @@ def tv(
         validate_config()
         return
 
-    quiet = ctx.obj.get("quiet", False)
     cfg = get_config()
 
-    # Use CLI option or config default
+    # Use CLI option or config default (after the first-run check, as above)
     if recent_threshold is None:
         recent_threshold = cfg.options.recent_threshold_hours
 
     # Combine CLI exclusions with config exclusions
     excluded_shows = list(exclude_show) + cfg.exclusions.shows
 
-    # Create cache
-    cache = Cache()
-
-    try:
-        # Resolve server and connect to Plex
-        server_url, server_token = _resolve_server(server)
-        try:
-            if server_url and server_token:
-                plex = PlexClient(url=server_url, token=server_token)
-            else:
-                plex = PlexClient()
-            plex.connect()
-        except PlexError as e:
-            console.print(f"[red]Plex error:[/red] {e}")
-            sys.exit(1)
-
-        # Resolve library names
-        library_names = _resolve_libraries(plex, library, plex.get_tv_libraries, "TV")
-        if library_names is None:
-            # Either listed libraries or no libraries found
-            return
-
-        # Connect to TVDB
-        try:
-            tvdb = TVDBClient(cache=cache)
-            tvdb.test_connection()
-        except TVDBError as e:
-            console.print(f"[red]TVDB error:[/red] {e}")
-            sys.exit(1)
-
-        # Scan each library
-        for lib_name in library_names:
-            if len(library_names) > 1:
-                console.print(f"\n[bold blue]Scanning library: {lib_name}[/bold blue]")
-
-            # Start statistics tracking
-            stats = ScanStatistics()
-            stats.start()
-
-            # Get ignored show IDs if --use-ignore-list flag is set
-            ignored_show_ids = cfg.tvdb.ignored_shows if use_ignore_list else None
-
-            if quiet:
-                # Quiet mode: no progress indicators
-                finder = EpisodeGapFinder(
-                    plex_client=plex,
-                    tvdb_client=tvdb,
-                    include_future=include_future,
-                    include_specials=include_specials,
-                    recent_threshold_hours=recent_threshold,
-                    excluded_shows=excluded_shows,
-                    ignored_show_ids=ignored_show_ids,
-                    context=_scan_context(lib_name, server),
-                )
-                report = finder.find_gaps(lib_name)
-            else:
-                # Normal mode with progress
-                from rich.progress import (
-                    BarColumn,
-                    Progress,
-                    SpinnerColumn,
-                    TaskProgressColumn,
-                    TextColumn,
-                )
-
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    TaskProgressColumn(),
-                    console=console,
-                    transient=False,
-                ) as progress:
-                    task = progress.add_task("Scanning...", total=None)
-                    progress_callback = _create_progress_updater(progress, task)
-
-                    # Find gaps
-                    finder = EpisodeGapFinder(
-                        plex_client=plex,
-                        tvdb_client=tvdb,
-                        include_future=include_future,
-                        include_specials=include_specials,
-                        recent_threshold_hours=recent_threshold,
-                        excluded_shows=excluded_shows,
-                        ignored_show_ids=ignored_show_ids,
-                        progress_callback=progress_callback,
-                        context=_scan_context(lib_name, server),
-                    )
-
-                    report = finder.find_gaps(lib_name)
-
-            # Stop statistics tracking
-            stats.stop()
-
-            # Output results using formatter
-            formatter = TVReportFormatter(report)
-            if format == "json":
-                console.print_json(formatter.to_json())
-            elif format == "csv":
-                console.print(formatter.to_csv())
-            else:
-                # Save CSV first (unless --no-csv)
-                csv_path = None
-                if not no_csv and report.shows_with_gaps:
-                    csv_path = formatter.save_csv()
-
-                # Show summary with option to view details
-                formatter.show_summary(stats, csv_path)
-
-        # Flush any pending cache writes
-        cache.flush()
+    # Get ignored show IDs if --use-ignore-list flag is set
+    ignored_show_ids = cfg.tvdb.ignored_shows if use_ignore_list else None
+
+    def make_finder(
+        plex: Any, tvdb: Any, lib_name: str, progress_callback: Callable[..., None] | None
+    ) -> EpisodeGapFinder:
+        return EpisodeGapFinder(
+            plex_client=plex,
+            tvdb_client=tvdb,
+            include_future=include_future,
+            include_specials=include_specials,
+            recent_threshold_hours=recent_threshold,
+            excluded_shows=excluded_shows,
+            ignored_show_ids=ignored_show_ids,
+            progress_callback=progress_callback,
+            context=_scan_context(lib_name, server),
+        )
 
-    except KeyboardInterrupt:
-        # Still flush cache on interrupt to preserve progress
-        cache.flush()
-        console.print("\n[yellow]Scan cancelled.[/yellow]")
-        sys.exit(130)
+    _run_scan(
+        ctx,
+        library=library,
+        server=server,
+        lib_type="TV",
+        get_libraries=lambda plex: plex.get_tv_libraries(),
+        connect_api=lambda cache: _connect_api(lambda: TVDBClient(cache=cache), TVDBError, "TVDB"),
+        make_finder=make_finder,
+        formatter_cls=TVReportFormatter,
+        has_gaps=lambda report: bool(report.shows_with_gaps),
+        format=format,
+        no_csv=no_csv,
+    )
 
 
 @main.command(cls=BannerCommand)
@@ -966,12 +1038,7 @@ def tv(
     multiple=True,
     help="Library name(s) to scan (can specify multiple)",
 )
-@click.option(
-    "--server",
-    "-s",
-    default=None,
-    help="Plex server name or index (default: first configured server)",
-)
+@_server_option
 @click.option("--include-future", is_flag=True, help="Include unreleased content")
 @click.option("--include-specials", is_flag=True, help="Include Season 0 (specials)")
 @click.option(
@@ -979,13 +1046,7 @@ def tv(
     is_flag=True,
     help="Use the ignored items list from config (managed via GUI)",
 )
-@click.option(
-    "--format",
-    "-f",
-    type=click.Choice(["text", "json", "csv"]),
-    default="text",
-    help="Output format",
-)
+@_format_option
 @click.pass_context
 def scan(
     ctx: click.Context,
@@ -1000,24 +1061,25 @@ def scan(
 
     If no --library is specified, lists available libraries for each type.
     """
-    # Show splash banner immediately
-    _show_splash()
-
-    # Load heavy modules with "Starting up..." indicator
-    _load_modules()
+    # Show splash banner immediately (heavy modules load behind it)
+    _ensure_startup(ctx, format)
 
     # Check for first-run (offers setup wizard if no config)
     _check_config_exists()
 
-    console.print()
-    console.print("[bold blue]Scanning both libraries...[/bold blue]")
-    console.print()
+    out = _status_console(format)
+    out.print()
+    out.print("[bold blue]Scanning both libraries...[/bold blue]")
+    out.print()
+
+    # Share one cache and one Plex connection between both subcommands
+    from complexionist.cache import Cache
 
-    # Set flag to skip splash in subcommands
-    ctx.obj["_skip_splash"] = True
+    ctx.obj["_cache"] = Cache()
+    ctx.obj["_plex"] = _connect_plex(server, out)
 
     # Invoke movies command
-    console.print("[bold]Movie Collections[/bold]")
+    out.print("[bold]Movie Collections[/bold]")
     ctx.invoke(
         movies,
         library=library,
@@ -1026,10 +1088,10 @@ def scan(
         use_ignore_list=use_ignore_list,
         format=format,
     )
-    console.print()
+    out.print()
 
     # Invoke tv command
-    console.print("[bold]TV Shows[/bold]")
+    out.print("[bold]TV Shows[/bold]")
     ctx.invoke(
         tv,
         library=library,
@@ -1051,85 +1113,77 @@ def config() -> None:
 def config_show() -> None:
     """Show current configuration."""
     from complexionist.cache import get_cache_file_path
-    from complexionist.config import find_config_file, get_config
+    from complexionist.config import get_config, get_config_path
 
     cfg = get_config()
-    config_file = find_config_file()
+    config_file = get_config_path()
     cache_file = get_cache_file_path()
 
-    console.print("[bold]Current Configuration[/bold]")
-    console.print()
-
-    if config_file:
-        console.print(f"[dim]Config file:[/dim] {config_file}")
-    else:
-        console.print("[dim]Config file:[/dim] (none - using defaults)")
-    console.print(f"[dim]Cache file:[/dim] {cache_file}")
-    console.print()
-
-    # Plex servers
-    console.print("[bold]Plex Servers:[/bold]")
+    # Assemble the block and print once
+    lines = [
+        "[bold]Current Configuration[/bold]",
+        "",
+        f"[dim]Config file:[/dim] {config_file or '(none - using defaults)'}",
+        f"[dim]Cache file:[/dim] {cache_file}",
+        "",
+        # Plex servers
+        "[bold]Plex Servers:[/bold]",
+    ]
     if cfg.plex.servers:
         for i, server in enumerate(cfg.plex.servers):
             name = server.name or f"Server {i}"
             url = server.url or "[red](not set)[/red]"
             token = "(set)" if server.token else "[red](not set)[/red]"
-            console.print(f"  [{i}] {name}")
-            console.print(f"      URL: {url}")
-            console.print(f"      Token: {token}")
-    else:
-        console.print("  [red](none configured)[/red]")
-    console.print()
-
-    # Options
-    console.print("[bold]Options:[/bold]")
-    console.print(f"  Recent threshold: {cfg.options.recent_threshold_hours} hours")
-    console.print(f"  Min collection size: {cfg.options.min_collection_size}")
-    console.print(f"  Min owned: {cfg.options.min_owned}")
-    console.print()
-
-    # Exclusions
-    console.print("[bold]Exclusions:[/bold]")
-    if cfg.exclusions.shows:
-        console.print(f"  Shows: {', '.join(cfg.exclusions.shows)}")
-    else:
-        console.print("  Shows: (none)")
-    if cfg.exclusions.collections:
-        console.print(f"  Collections: {', '.join(cfg.exclusions.collections)}")
+            lines += [f"  [{i}] {name}", f"      URL: {url}", f"      Token: {token}"]
     else:
-        console.print("  Collections: (none)")
+        lines.append("  [red](none configured)[/red]")
+
+    shows = ", ".join(cfg.exclusions.shows) or "(none)"
+    collections = ", ".join(cfg.exclusions.collections) or "(none)"
+    lines += [
+        "",
+        # Options
+        "[bold]Options:[/bold]",
+        f"  Recent threshold: {cfg.options.recent_threshold_hours} hours",
+        f"  Min collection size: {cfg.options.min_collection_size}",
+        f"  Min owned: {cfg.options.min_owned}",
+        "",
+        # Exclusions
+        "[bold]Exclusions:[/bold]",
+        f"  Shows: {shows}",
+        f"  Collections: {collections}",
+    ]
+    console.print("\n".join(lines))
 
 
 @config.command(name="path")
 def config_path() -> None:
     """Show configuration file paths."""
     from complexionist.cache import get_cache_file_path
-    from complexionist.config import find_config_file, get_config_paths
+    from complexionist.config import get_config_paths
 
-    console.print("[bold]Configuration paths (in priority order):[/bold]")
-    config_file = find_config_file()
+    lines = ["[bold]Configuration paths (in priority order):[/bold]"]
+    # One stat per candidate; the first existing path is the active one
+    # (same rule as find_config_file)
+    found_active = False
 
     for path in get_config_paths():
-        if path.exists():
-            if path == config_file:
-                console.print(f"  [green]{path}[/green] (active)")
-            else:
-                console.print(f"  {path} (exists)")
+        if not path.exists():
+            lines.append(f"  [dim]{path}[/dim]")
+        elif not found_active:
+            found_active = True
+            lines.append(f"  [green]{path}[/green] (active)")
         else:
-            console.print(f"  [dim]{path}[/dim]")
+            lines.append(f"  {path} (exists)")
 
-    console.print()
-    console.print("[bold]Other paths:[/bold]")
-    cache_file = get_cache_file_path()
-    console.print(f"  Cache file: {cache_file}")
+    lines += ["", "[bold]Other paths:[/bold]", f"  Cache file: {get_cache_file_path()}"]
+    console.print("\n".join(lines))
 
 
 @config.command(name="init")
 @click.option("--force", is_flag=True, help="Overwrite existing config file")
 def config_init(force: bool) -> None:
     """Create a default configuration file (INI format)."""
-    from pathlib import Path
-
     from complexionist.config import save_default_config
 
     # Save in current directory for portability
@@ -1192,39 +1246,39 @@ def cache_stats() -> None:
     cache = Cache()
     stats = cache.stats()
 
-    console.print("[bold]Cache Statistics[/bold]")
-    console.print()
+    # Assemble the block and print once
+    lines = ["[bold]Cache Statistics[/bold]", ""]
 
     if stats.total_entries == 0:
-        console.print("[dim]Cache is empty.[/dim]")
-        console.print()
-        console.print(f"Cache location: {cache.cache_dir}")
+        lines += ["[dim]Cache is empty.[/dim]", "", f"Cache location: {cache.cache_dir}"]
+        console.print("\n".join(lines))
         return
 
-    console.print(f"[bold]Total entries:[/bold] {stats.total_entries}")
-    console.print(f"[bold]Total size:[/bold] {stats.total_size_kb:.1f} KB")
-    console.print()
-
-    console.print("[bold]By category:[/bold]")
-    console.print(f"  TMDB movies:      {stats.tmdb_movies}")
-    console.print(f"  TMDB collections: {stats.tmdb_collections}")
-    console.print(f"  TVDB episodes:    {stats.tvdb_episodes}")
-    console.print()
+    lines += [
+        f"[bold]Total entries:[/bold] {stats.total_entries}",
+        f"[bold]Total size:[/bold] {stats.total_size_kb:.1f} KB",
+        "",
+        "[bold]By category:[/bold]",
+        f"  TMDB movies:      {stats.tmdb_movies}",
+        f"  TMDB collections: {stats.tmdb_collections}",
+        f"  TVDB episodes:    {stats.tvdb_episodes}",
+        "",
+    ]
 
     if stats.oldest_entry:
-        console.print(f"[bold]Oldest entry:[/bold] {stats.oldest_entry.strftime('%Y-%m-%d %H:%M')}")
+        lines.append(f"[bold]Oldest entry:[/bold] {stats.oldest_entry:%Y-%m-%d %H:%M}")
     if stats.newest_entry:
-        console.print(f"[bold]Newest entry:[/bold] {stats.newest_entry.strftime('%Y-%m-%d %H:%M')}")
-    console.print()
+        lines.append(f"[bold]Newest entry:[/bold] {stats.newest_entry:%Y-%m-%d %H:%M}")
+    lines.append("")
 
     # Check for expired entries
     expired = cache.get_expired_count()
     if expired > 0:
-        console.print(f"[yellow]Expired entries:[/yellow] {expired}")
-        console.print("[dim]Run 'cache clear' to remove expired entries.[/dim]")
+        lines.append(f"[yellow]Expired entries:[/yellow] {expired}")
+        lines.append("[dim]Run 'cache clear' to remove expired entries.[/dim]")
 
-    console.print()
-    console.print(f"Cache location: {cache.cache_dir}")
+    lines += ["", f"Cache location: {cache.cache_dir}"]
+    console.print("\n".join(lines))
 
 
 @cache.command(name="refresh")
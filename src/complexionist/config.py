@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import configparser
+import functools
+import importlib.util
 import logging
 import os
 import re
@@ -14,12 +16,9 @@ from pydantic import BaseModel, Field, ValidationError
 
 from complexionist.errors import ConfigError
 
-try:
-    import yaml
-
-    _HAS_YAML = True
-except ImportError:
-    _HAS_YAML = False
+# PyYAML is optional and only needed for legacy YAML configs, so it is
+# imported on first use; checking for it here avoids its ~20ms import.
+_HAS_YAML = importlib.util.find_spec("yaml") is not None
 
 logger = logging.getLogger(__name__)
 
@@ -149,16 +148,25 @@ def get_config_paths() -> list[Path]:
     Returns:
         List of paths to check for config files.
     """
-    paths = []
+    return list(_build_config_paths(get_exe_directory(), Path.cwd(), Path.home(), _HAS_YAML))
 
-    exe_dir = get_exe_directory()
-    home_dir = Path.home() / ".complexionist"
+
+@functools.cache
+def _build_config_paths(
+    exe_dir: Path, cwd: Path, home: Path, include_yaml: bool
+) -> tuple[Path, ...]:
+    """Build the candidate list for one set of search roots.
+
+    Keyed on the roots themselves, so a changed working directory or home
+    directory gets a fresh list rather than a stale one.
+    """
+    paths = []
+    home_dir = home / ".complexionist"
 
     # 1. Exe directory - INI format (highest priority)
     paths.append(exe_dir / "complexionist.ini")
 
     # 2. Current directory - INI format
-    cwd = Path.cwd()
     if cwd != exe_dir:  # Avoid duplicates
         paths.append(cwd / "complexionist.ini")
 
@@ -166,7 +174,7 @@ def get_config_paths() -> list[Path]:
     paths.append(home_dir / "complexionist.ini")
 
     # 4. Legacy YAML support (backwards compatibility, only if PyYAML installed)
-    if _HAS_YAML:
+    if include_yaml:
         paths.append(cwd / "config.yaml")
         paths.append(cwd / "config.yml")
         paths.append(cwd / ".complexionist.yaml")
@@ -174,7 +182,7 @@ def get_config_paths() -> list[Path]:
         paths.append(home_dir / "config.yaml")
         paths.append(home_dir / "config.yml")
 
-    return paths
+    return tuple(paths)
 
 
 def find_config_file() -> Path | None:
@@ -189,6 +197,16 @@ def find_config_file() -> Path | None:
     return None
 
 
+# Matches ${VAR} or $VAR
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)")
+
+
+def _replace_env_var(match: re.Match[str]) -> str:
+    """Substitute one ${VAR}/$VAR match with its environment value (or "")."""
+    var_name = match.group(1) or match.group(2)
+    return os.environ.get(var_name, "")
+
+
 def _expand_env_vars(value: Any) -> Any:
     """Recursively expand environment variables in config values.
 
@@ -198,21 +216,26 @@ def _expand_env_vars(value: Any) -> Any:
         value: Config value (string, dict, list, or other).
 
     Returns:
-        Value with environment variables expanded.
+        Value with environment variables expanded. Containers with nothing
+        to expand are returned as-is rather than copied.
     """
     if isinstance(value, str):
-        # Pattern matches ${VAR} or $VAR
-        pattern = re.compile(r"\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)")
-
-        def replace(match: re.Match[str]) -> str:
-            var_name = match.group(1) or match.group(2)
-            return os.environ.get(var_name, "")
-
-        return pattern.sub(replace, value)
+        # Most values have no references; skip the regex engine for them
+        if "$" not in value:
+            return value
+        return _ENV_VAR_RE.sub(_replace_env_var, value)
     elif isinstance(value, dict):
-        return {k: _expand_env_vars(v) for k, v in value.items()}
+        changed = {k: new for k, v in value.items() if (new := _expand_env_vars(v)) is not v}
+        return {**value, **changed} if changed else value
     elif isinstance(value, list):
-        return [_expand_env_vars(item) for item in value]
+        result: list[Any] | None = None
+        for i, item in enumerate(value):
+            new = _expand_env_vars(item)
+            if new is not item:
+                if result is None:
+                    result = list(value)
+                result[i] = new
+        return value if result is None else result
     return value
 
 
@@ -253,6 +276,11 @@ def _parse_int_list(value: str) -> list[int]:
     """
     if not value or not value.strip():
         return []
+    try:
+        # Common case: a clean list. int() tolerates the spaces around items.
+        return [int(item) for item in value.split(",")]
+    except ValueError:
+        pass  # Empty or invalid items; fall back to the forgiving per-item parse
     result = []
     for item in value.split(","):
         item = item.strip()
@@ -264,6 +292,11 @@ def _parse_int_list(value: str) -> list[int]:
     return result
 
 
+# Typed keys recognised in the [options] section
+_BOOL_OPTIONS = frozenset({"find"})
+_INT_OPTIONS = frozenset({"recent_threshold_hours", "min_collection_size", "min_owned"})
+
+
 def _load_ini_config(path: Path) -> dict[str, Any]:
     """Load configuration from INI file.
 
@@ -273,29 +306,32 @@ def _load_ini_config(path: Path) -> dict[str, Any]:
     Returns:
         Dictionary structure matching AppConfig schema.
     """
-    parser = configparser.ConfigParser()
+    # No interpolation: values are taken verbatim, so a '%' in a token or
+    # path is not mistaken for a %(name)s reference
+    parser = configparser.ConfigParser(interpolation=None)
     parser.read(path, encoding="utf-8")
 
+    # Snapshot each section once; the lookups below are plain dict gets
+    sections: dict[str, dict[str, str]] = {
+        name: dict(parser.items(name)) for name in parser.sections()
+    }
+
     config: dict[str, Any] = {}
 
     # Parse Plex server(s) — supports both old [plex] and new [plex:N] formats
     plex_servers: list[dict[str, str]] = []
 
     # New format: [plex:0], [plex:1], etc.
-    for section in parser.sections():
-        if section.startswith("plex:"):
-            server: dict[str, str] = {}
-            for key in ("name", "url", "token"):
-                value = parser.get(section, key, fallback="")
-                if value:
-                    server[key] = value
+    for name, values in sections.items():
+        if name.startswith("plex:"):
+            server = {key: values[key] for key in ("name", "url", "token") if values.get(key)}
             if server.get("url") or server.get("token"):
                 plex_servers.append(server)
 
     # Old format: [plex] with url + token (backward compatibility)
-    if not plex_servers and parser.has_section("plex"):
-        url = parser.get("plex", "url", fallback=None)
-        token = parser.get("plex", "token", fallback=None)
+    if not plex_servers and "plex" in sections:
+        url = sections["plex"].get("url")
+        token = sections["plex"].get("token")
         if url or token:
             plex_servers.append(
                 {
@@ -309,70 +345,57 @@ def _load_ini_config(path: Path) -> dict[str, Any]:
         config["plex"] = {"servers": plex_servers}
 
     # Parse [tmdb] section
-    if parser.has_section("tmdb"):
+    if "tmdb" in sections:
+        tmdb = sections["tmdb"]
         tmdb_config: dict[str, Any] = {}
-        api_key = parser.get("tmdb", "api_key", fallback=None)
-        if api_key:
-            tmdb_config["api_key"] = api_key
-        if parser.has_option("tmdb", "ignored_collections"):
-            tmdb_config["ignored_collections"] = _parse_int_list(
-                parser.get("tmdb", "ignored_collections")
-            )
+        if tmdb.get("api_key"):
+            tmdb_config["api_key"] = tmdb["api_key"]
+        if "ignored_collections" in tmdb:
+            tmdb_config["ignored_collections"] = _parse_int_list(tmdb["ignored_collections"])
         if tmdb_config:
             config["tmdb"] = tmdb_config
 
     # Parse [tvdb] section
-    if parser.has_section("tvdb"):
-        tvdb_config: dict[str, Any] = {
-            "api_key": parser.get("tvdb", "api_key", fallback=None),
-        }
-        if parser.has_option("tvdb", "ignored_shows"):
-            tvdb_config["ignored_shows"] = _parse_int_list(parser.get("tvdb", "ignored_shows"))
-        # Remove None values but keep lists
-        config["tvdb"] = {k: v for k, v in tvdb_config.items() if v is not None and v != ""}
+    if "tvdb" in sections:
+        tvdb = sections["tvdb"]
+        tvdb_config: dict[str, Any] = {}
+        if tvdb.get("api_key"):
+            tvdb_config["api_key"] = tvdb["api_key"]
+        if "ignored_shows" in tvdb:
+            tvdb_config["ignored_shows"] = _parse_int_list(tvdb["ignored_shows"])
+        config["tvdb"] = tvdb_config
 
     # Parse [options] section
-    if parser.has_section("options"):
+    if "options" in sections:
         options: dict[str, Any] = {}
-        for key in [
-            "find",
-        ]:
-            if parser.has_option("options", key):
-                options[key] = _parse_bool(parser.get("options", key))
-        for key in [
-            "recent_threshold_hours",
-            "min_collection_size",
-            "min_owned",
-        ]:
-            if parser.has_option("options", key):
+        for key, value in sections["options"].items():
+            if key in _BOOL_OPTIONS:
+                options[key] = _parse_bool(value)
+            elif key in _INT_OPTIONS:
                 try:
-                    options[key] = int(parser.get("options", key))
+                    options[key] = int(value)
                 except ValueError:
                     pass  # Keep default
         if options:
             config["options"] = options
 
     # Parse [exclusions] section
-    if parser.has_section("exclusions"):
-        exclusions: dict[str, list[str]] = {}
-        if parser.has_option("exclusions", "shows"):
-            exclusions["shows"] = _parse_list(parser.get("exclusions", "shows"))
-        if parser.has_option("exclusions", "collections"):
-            exclusions["collections"] = _parse_list(parser.get("exclusions", "collections"))
+    if "exclusions" in sections:
+        exclusions = {
+            key: _parse_list(value)
+            for key, value in sections["exclusions"].items()
+            if key in ("shows", "collections")
+        }
         if exclusions:
             config["exclusions"] = exclusions
 
     # Parse [paths] section
-    if parser.has_section("paths"):
-        paths: dict[str, str | None] = {}
-        if parser.has_option("paths", "plex_prefix"):
-            value = parser.get("paths", "plex_prefix").strip()
-            if value:
-                paths["plex_prefix"] = value
-        if parser.has_option("paths", "local_prefix"):
-            value = parser.get("paths", "local_prefix").strip()
-            if value:
-                paths["local_prefix"] = value
+    if "paths" in sections:
+        paths = {
+            key: value.strip()
+            for key, value in sections["paths"].items()
+            if key in ("plex_prefix", "local_prefix") and value.strip()
+        }
         if paths:
             config["paths"] = paths
 
@@ -391,9 +414,14 @@ def _load_yaml_config(path: Path) -> dict[str, Any]:
     if not _HAS_YAML:
         logger.warning("PyYAML not installed — cannot load %s. Use INI format instead.", path)
         return {}
+    import yaml
+
+    # libyaml-backed loader is several times faster; fall back to pure Python
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        with open(path, encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        # Binary mode lets libyaml scan the bytes without a decode pass
+        with open(path, "rb") as f:
+            return yaml.load(f, Loader=loader) or {}
     except (yaml.YAMLError, OSError) as e:
         logger.error("Failed to load config from %s: %s", path, e)
         return {}
@@ -458,7 +486,9 @@ def get_config_path() -> Path | None:
 def get_config() -> AppConfig:
     """Get the current configuration.
 
-    Loads from file if not already loaded.
+    Loads from file on first call and returns the cached instance after
+    that, so a process parses its config once. Call reset_config() after
+    the file changes.
 
     Returns:
         Current application configuration.
@@ -481,10 +511,10 @@ def has_valid_config() -> bool:
     Returns:
         True if all required credentials are configured.
     """
-    if find_config_file() is None:
+    cfg = get_config()
+    if get_config_path() is None:
         return False
 
-    cfg = get_config()
     has_plex = bool(cfg.plex.servers and cfg.plex.servers[0].url and cfg.plex.servers[0].token)
     return bool(has_plex and cfg.tmdb.api_key and cfg.tvdb.api_key)
 
@@ -512,54 +542,25 @@ def get_config_dir() -> Path:
     return config_dir
 
 
-def save_default_config(
-    path: Path | None = None,
-    plex_url: str = "",
-    plex_token: str = "",
-    plex_name: str = "Plex Server",
-    tmdb_api_key: str = "",
-    tvdb_api_key: str = "",
-) -> Path:
-    """Save a default INI config file.
-
-    Args:
-        path: Where to save. Defaults to ./complexionist.ini (current directory).
-        plex_url: Plex server URL (optional, can use env var).
-        plex_token: Plex token (optional, can use env var).
-        plex_name: Plex server friendly name.
-        tmdb_api_key: TMDB API key (optional, can use env var).
-        tvdb_api_key: TVDB API key (optional, can use env var).
-
-    Returns:
-        Path to saved config file.
-    """
-    if path is None:
-        path = Path.cwd() / "complexionist.ini"
-
-    # Use provided values or fall back to env var syntax
-    plex_url_value = plex_url or "${PLEX_URL}"
-    plex_token_value = plex_token or "${PLEX_TOKEN}"
-    tmdb_key_value = tmdb_api_key or "${TMDB_API_KEY}"
-    tvdb_key_value = tvdb_api_key or "${TVDB_API_KEY}"
-
-    default_config = f"""\
-# ComPlexionist Configuration
+# Template for save_default_config(). Raw so the UNC path examples keep their
+# backslashes; literal braces are doubled for str.format_map().
+_DEFAULT_INI_TEMPLATE = r"""# ComPlexionist Configuration
 # See: https://github.com/The-Ant-Forge/ComPlexionist
 # You can use environment variables with ${{VAR}} syntax
 
 [plex:0]
 # Plex server (add more with [plex:1], [plex:2], etc.)
 name = {plex_name}
-url = {plex_url_value}
-token = {plex_token_value}
+url = {plex_url}
+token = {plex_token}
 
 [tmdb]
 # TMDB API key - Get yours at: https://www.themoviedb.org/settings/api
-api_key = {tmdb_key_value}
+api_key = {tmdb_api_key}
 
 [tvdb]
 # TVDB API key - Get yours at: https://thetvdb.com/api-information
-api_key = {tvdb_key_value}
+api_key = {tvdb_api_key}
 
 [options]
 # Skip episodes aired within this many hours
@@ -577,17 +578,57 @@ collections =
 
 [paths]
 # Path mapping for remote/network access (optional)
-# If Plex returns paths like \\volume1\video\\... but your local machine
-# accesses them as \\Storage4\video\\..., configure the mapping here:
+# If Plex returns paths like \\volume1\video\... but your local machine
+# accesses them as \\Storage4\video\..., configure the mapping here:
 # plex_prefix = \\volume1\video
 # local_prefix = \\Storage4\video
 """
 
+
+def save_default_config(
+    path: Path | None = None,
+    plex_url: str = "",
+    plex_token: str = "",
+    plex_name: str = "Plex Server",
+    tmdb_api_key: str = "",
+    tvdb_api_key: str = "",
+) -> Path:
+    """Save a default INI config file.
+
+    Args:
+        path: Where to save. Defaults to ./complexionist.ini (current directory).
+        plex_url: Plex server URL (optional, can use env var).
+        plex_token: Plex token (optional, can use env var).
+        plex_name: Plex server friendly name.
+        tmdb_api_key: TMDB API key (optional, can use env var).
+        tvdb_api_key: TVDB API key (optional, can use env var).
+
+    Returns:
+        Path to saved config file.
+    """
+    if path is None:
+        path = Path.cwd() / "complexionist.ini"
+
+    # Use provided values or fall back to env var syntax
+    plex_url_value = plex_url or "${PLEX_URL}"
+    plex_token_value = plex_token or "${PLEX_TOKEN}"
+    tmdb_key_value = tmdb_api_key or "${TMDB_API_KEY}"
+    tvdb_key_value = tvdb_api_key or "${TVDB_API_KEY}"
+
+    default_config = _DEFAULT_INI_TEMPLATE.format_map(
+        {
+            "plex_name": plex_name,
+            "plex_url": plex_url_value,
+            "plex_token": plex_token_value,
+            "tmdb_api_key": tmdb_key_value,
+            "tvdb_api_key": tvdb_key_value,
+        }
+    )
+
     # Ensure parent directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(default_config)
+    path.write_text(default_config, encoding="utf-8")
 
     return path
 
@@ -2,6 +2,7 @@
 
 import re
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 
 from complexionist.errors import log_error
@@ -11,7 +12,7 @@ from complexionist.gaps.models import (
     SeasonGap,
     ShowGap,
 )
-from complexionist.plex import PlexClient, PlexEpisode
+from complexionist.plex import PlexClient, PlexEpisode, PlexShow
 from complexionist.statistics import record_skipped_item
 from complexionist.tvdb import (
     TVDBClient,
@@ -19,29 +20,41 @@ from complexionist.tvdb import (
     TVDBError,
     TVDBNotFoundError,
     TVDBRateLimitError,
+    TVDBSeries,
 )
-from complexionist.utils import retry_with_backoff
+from complexionist.utils import past_date_cutoff, retry_with_backoff
+
+# Parallel TVDB lookups per scan. TVDB v4 has no per-second quota; rate-limit
+# responses are still retried with backoff by _fetch_tvdb_show.
+TVDB_WORKERS = 4
+
+# Parallel Plex episode fetches per scan. Kept small: the server is often a
+# NAS or other low-power box that is also serving streams.
+PLEX_WORKERS = 4
 
 # Maximum plausible number of extra episodes in one multi-episode file.
 # Ranges spanning more than this are treated as false positives
 # (e.g. resolution suffixes like S01E01-1080p misread as a range).
 MAX_MULTI_EPISODE_SPAN = 20
 
-# Multi-episode filename patterns
-# Examples: S02E01-02, S02E01-E02, S02E01E02, S02E01-E02-E03
-MULTI_EPISODE_PATTERNS = [
+# Multi-episode filename pattern: SxxEyy followed by one of the range forms
+# below. Each form captures the range end in its own group.
+# Examples: S02E01-02, S02E01-E02, S02E01E02, S02E01E02E03
+MULTI_EPISODE_PATTERN = re.compile(
+    r"S(\d+)E(\d+)(?:"
     # S02E01-02 or S02E01-2 (dash with numbers). The negative lookahead
     # rejects resolution suffixes: a range end followed by 'p' (S01E01-1080p)
     # is not an episode range, and backtracking into a shorter number
     # (e.g. "108" of "1080p") is blocked by rejecting a trailing digit.
-    re.compile(r"S(\d+)E(\d+)-(\d+)(?![0-9p])", re.IGNORECASE),
+    r"-(\d+)(?![0-9p])"
     # S02E01-E02 (dash with E prefix)
-    re.compile(r"S(\d+)E(\d+)-E(\d+)", re.IGNORECASE),
-    # S02E01E02 (consecutive E numbers)
-    re.compile(r"S(\d+)E(\d+)E(\d+)", re.IGNORECASE),
-    # S02E01E02E03 (multiple consecutive)
-    re.compile(r"S(\d+)E(\d+)(?:E(\d+))+", re.IGNORECASE),
-]
+    r"|-E(\d+)"
+    # S02E01E02 or S02E01E02E03 (consecutive E numbers). Both the first and
+    # the last are captured; each is tried as the range end.
+    r"|E(\d+)(?:E(\d+))*"
+    r")",
+    re.IGNORECASE,
+)
 
 
 def parse_multi_episode_filename(file_path: str | None) -> list[tuple[int, int]]:
@@ -60,26 +73,27 @@ def parse_multi_episode_filename(file_path: str | None) -> list[tuple[int, int]]
     seen: set[tuple[int, int]] = set()
     episodes: list[tuple[int, int]] = []
 
-    # Check each pattern
-    for pattern in MULTI_EPISODE_PATTERNS:
-        matches = pattern.findall(file_path)
-        for match in matches:
-            if len(match) >= 3:
-                season = int(match[0])
-                start_ep = int(match[1])
-                end_ep = int(match[2])
-
-                # Sanity: reject inverted or implausibly large ranges
-                # (e.g. a resolution token misparsed as a range end).
-                if end_ep < start_ep or end_ep - start_ep > MAX_MULTI_EPISODE_SPAN:
-                    continue
+    for match in MULTI_EPISODE_PATTERN.finditer(file_path):
+        season_str, start_str, *end_strs = match.groups()
+        season = int(season_str)
+        start_ep = int(start_str)
+
+        for end_str in end_strs:
+            if end_str is None:
+                continue
+            end_ep = int(end_str)
+
+            # Sanity: reject inverted or implausibly large ranges
+            # (e.g. a resolution token misparsed as a range end).
+            if end_ep < start_ep or end_ep - start_ep > MAX_MULTI_EPISODE_SPAN:
+                continue
 
-                # Generate range
-                for ep_num in range(start_ep, end_ep + 1):
-                    key = (season, ep_num)
-                    if key not in seen:
-                        seen.add(key)
-                        episodes.append(key)
+            # Generate range
+            for ep_num in range(start_ep, end_ep + 1):
+                key = (season, ep_num)
+                if key not in seen:
+                    seen.add(key)
+                    episodes.append(key)
 
     return episodes
 
@@ -160,71 +174,45 @@ class EpisodeGapFinder:
             and s.tvdb_id not in self.ignored_show_ids
         ]
 
-        # Step 3: Process each show and find gaps
+        # Step 3: Process each show and find gaps. Plex episode lists and TVDB
+        # lookups for all shows are fetched on small thread pools, overlapping
+        # their round-trips. Results are consumed in show order, so reports
+        # and progress are the same as a serial scan. PlexClient gives each
+        # worker thread its own connection; plexapi sessions are not shared.
         show_gaps: list[ShowGap] = []
         total_episodes_owned = 0
         total = len(shows_with_tvdb)
 
-        for i, show in enumerate(shows_with_tvdb):
-            self._progress(f"Analyzing: {show.title}", i + 1, total)
-
-            # Get episodes from Plex for this show
-            plex_episodes = self.plex.get_episodes(show.rating_key)
-            owned_episodes = self._build_owned_episode_set(plex_episodes)
-            total_episodes_owned += len(owned_episodes)
-
-            # Get first episode file path for folder navigation
-            first_episode_path = next(
-                (ep.file_path for ep in plex_episodes if ep.file_path),
-                None,
-            )
-
-            # Get resolution/codec from the last episode (most recent addition)
-            last_episode = plex_episodes[-1] if plex_episodes else None
-            last_resolution = last_episode.resolution if last_episode else None
-            last_video_codec = last_episode.video_codec if last_episode else None
-
-            # Get series info and episodes from TVDB
-            try:
-                # Fetch series info first - we need status for episode cache TTL
-                series_info = self.tvdb.get_series(show.tvdb_id)  # type: ignore[arg-type]
-                poster_url = series_info.image
-                tvdb_episodes = self._fetch_tvdb_episodes(
-                    show.tvdb_id,  # type: ignore[arg-type]
-                    series_status=series_info.status,
-                )
-            except TVDBNotFoundError:
-                # Show not found on TVDB, skip
-                continue
-            except TVDBError as e:
-                # Log API errors and continue with next show
-                log_error(e, self._log_context(f"TVDB API error for show: {show.title}"))
-                record_skipped_item()
-                continue
-            except Exception as e:
-                # Log unexpected errors and continue
-                log_error(e, self._log_context(f"Unexpected error processing show: {show.title}"))
-                record_skipped_item()
-                continue
-
-            # Filter TVDB episodes
-            tvdb_episodes = self._filter_tvdb_episodes(tvdb_episodes)
-
-            # Find missing episodes
-            gap = self._find_show_gaps(
-                tvdb_id=show.tvdb_id,  # type: ignore[arg-type]
-                show_title=show.title,
-                owned_episodes=owned_episodes,
-                tvdb_episodes=tvdb_episodes,
-                poster_url=poster_url,
-                first_episode_path=first_episode_path,
-                status=series_info.status,
-                resolution=last_resolution,
-                video_codec=last_video_codec,
-            )
-
-            if gap and gap.missing_count > 0:
-                show_gaps.append(gap)
+        plex_executor = ThreadPoolExecutor(max_workers=PLEX_WORKERS)
+        tvdb_executor = ThreadPoolExecutor(max_workers=TVDB_WORKERS)
+        try:
+            plex_futures = [
+                plex_executor.submit(self.plex.get_episodes, show.rating_key)
+                for show in shows_with_tvdb
+            ]
+            tvdb_futures = [
+                tvdb_executor.submit(self._fetch_tvdb_show, show.tvdb_id)  # type: ignore[arg-type]
+                for show in shows_with_tvdb
+            ]
+            for i, (show, plex_future, tvdb_future) in enumerate(
+                zip(shows_with_tvdb, plex_futures, tvdb_futures, strict=True)
+            ):
+                self._progress(f"Analyzing: {show.title}", i + 1, total)
+                try:
+                    plex_episodes = plex_future.result()
+                except Exception as e:
+                    # One show's failed fetch skips that show, not the scan
+                    log_error(e, self._log_context(f"Plex error loading show: {show.title}"))
+                    record_skipped_item()
+                    continue
+                gap, owned_count = self._process_show(show, plex_episodes, tvdb_future.result)
+                total_episodes_owned += owned_count
+                if gap and gap.missing_count > 0:
+                    show_gaps.append(gap)
+        finally:
+            # Don't wait on queued fetches if the scan is aborted (e.g. Ctrl+C)
+            plex_executor.shutdown(wait=True, cancel_futures=True)
+            tvdb_executor.shutdown(wait=True, cancel_futures=True)
 
         # Sort by missing count (most missing first)
         show_gaps.sort(key=lambda g: g.missing_count, reverse=True)
@@ -237,6 +225,89 @@ class EpisodeGapFinder:
             shows_with_gaps=show_gaps,
         )
 
+    @retry_with_backoff(
+        max_retries=3,
+        base_delay=1.0,
+        retry_on=(TVDBRateLimitError,),
+    )
+    def _fetch_tvdb_show(self, tvdb_id: int) -> tuple[TVDBSeries, list[TVDBEpisode]]:
+        """Fetch series info and all episodes for a show from TVDB.
+
+        Runs on a worker thread.
+
+        Args:
+            tvdb_id: TVDB series ID.
+
+        Returns:
+            Tuple of (series info, all TVDB episodes).
+        """
+        return self.tvdb.get_series_with_episodes(tvdb_id)
+
+    def _process_show(
+        self,
+        show: PlexShow,
+        plex_episodes: list[PlexEpisode],
+        tvdb_result: Callable[[], tuple[TVDBSeries, list[TVDBEpisode]]],
+    ) -> tuple[ShowGap | None, int]:
+        """Compare one show's Plex episodes against its TVDB episode list.
+
+        Args:
+            show: Plex show with a TVDB ID.
+            plex_episodes: The show's episodes from Plex.
+            tvdb_result: Returns the show's (series info, episodes) from TVDB,
+                raising any error the lookup hit.
+
+        Returns:
+            Tuple of (gap or None, number of owned episodes).
+        """
+        owned_episodes = self._build_owned_episode_set(plex_episodes)
+
+        # Get first episode file path for folder navigation
+        first_episode_path = next(
+            (ep.file_path for ep in plex_episodes if ep.file_path),
+            None,
+        )
+
+        # Get resolution/codec from the last episode (most recent addition)
+        last_episode = plex_episodes[-1] if plex_episodes else None
+        last_resolution = last_episode.resolution if last_episode else None
+        last_video_codec = last_episode.video_codec if last_episode else None
+
+        # Get series info and episodes from TVDB
+        try:
+            series_info, tvdb_episodes = tvdb_result()
+            poster_url = series_info.image
+        except TVDBNotFoundError:
+            # Show not found on TVDB, skip
+            return None, len(owned_episodes)
+        except TVDBError as e:
+            # Log API errors and continue with next show
+            log_error(e, self._log_context(f"TVDB API error for show: {show.title}"))
+            record_skipped_item()
+            return None, len(owned_episodes)
+        except Exception as e:
+            # Log unexpected errors and continue
+            log_error(e, self._log_context(f"Unexpected error processing show: {show.title}"))
+            record_skipped_item()
+            return None, len(owned_episodes)
+
+        # Filter TVDB episodes
+        tvdb_episodes = self._filter_tvdb_episodes(tvdb_episodes)
+
+        # Find missing episodes
+        gap = self._find_show_gaps(
+            tvdb_id=show.tvdb_id,  # type: ignore[arg-type]
+            show_title=show.title,
+            owned_episodes=owned_episodes,
+            tvdb_episodes=tvdb_episodes,
+            poster_url=poster_url,
+            first_episode_path=first_episode_path,
+            status=series_info.status,
+            resolution=last_resolution,
+            video_codec=last_video_codec,
+        )
+        return gap, len(owned_episodes)
+
     def _build_owned_episode_set(self, episodes: list[PlexEpisode]) -> set[tuple[int, int]]:
         """Build a set of owned episode identifiers.
 
@@ -255,37 +326,16 @@ class EpisodeGapFinder:
             owned.add((ep.season_number, ep.episode_number))
 
             # Check for multi-episode files
-            multi_eps = parse_multi_episode_filename(ep.file_path)
-            for season, ep_num in multi_eps:
-                owned.add((season, ep_num))
+            owned.update(parse_multi_episode_filename(ep.file_path))
 
         return owned
 
-    @retry_with_backoff(
-        max_retries=3,
-        base_delay=1.0,
-        retry_on=(TVDBRateLimitError,),
-    )
-    def _fetch_tvdb_episodes(
-        self, tvdb_id: int, series_status: str | None = None
-    ) -> list[TVDBEpisode]:
-        """Fetch all episodes for a series from TVDB.
-
-        Args:
-            tvdb_id: TVDB series ID.
-            series_status: Optional series status for cache TTL optimization.
-
-        Returns:
-            List of TVDB episodes.
-        """
-        return self.tvdb.get_series_episodes(tvdb_id, series_status=series_status)
-
     def _filter_tvdb_episodes(self, episodes: list[TVDBEpisode]) -> list[TVDBEpisode]:
         """Filter TVDB episodes based on settings.
 
-        Note: the future-episode filter relies on ``is_aired``, which uses
-        ``is_date_past()`` (``complexionist.utils``) and therefore already
-        applies a 24-hour grace period. The ``recent_threshold_hours``
+        Note: the future-episode filter matches ``is_aired``: it compares
+        against ``past_date_cutoff()`` (``complexionist.utils``) and therefore
+        already applies a 24-hour grace period. The ``recent_threshold_hours``
         filter below stacks on top of that grace, so with the default 24h
         grace, thresholds of 48 hours or less add no extra filtering.
 
@@ -295,33 +345,33 @@ class EpisodeGapFinder:
         Returns:
             Filtered list of episodes.
         """
-        filtered = []
+        # Resolve the settings and date cutoffs once, so the per-episode test
+        # is plain comparisons. A cutoff of None disables that filter.
+        include_specials = self.include_specials
 
-        # Calculate the recent threshold cutoff
+        # Episodes must have aired before this date (same rule as is_aired)
+        aired_before = None if self.include_future else past_date_cutoff()
+
+        # Calculate the recent threshold cutoff. Air dates are whole days
+        # (midnight UTC), so an episode is within the threshold exactly when
+        # its date is after the cutoff's UTC date.
         if self.recent_threshold_hours > 0:
-            recent_cutoff = datetime.now(UTC) - timedelta(hours=self.recent_threshold_hours)
+            recent_cutoff = (
+                datetime.now(UTC) - timedelta(hours=self.recent_threshold_hours)
+            ).date()
         else:
             recent_cutoff = None
 
-        for ep in episodes:
+        return [
+            ep
+            for ep in episodes
             # Filter specials (Season 0)
-            if not self.include_specials and ep.is_special:
-                continue
-
+            if (include_specials or ep.season_number != 0)
             # Filter future episodes
-            if not self.include_future and not ep.is_aired:
-                continue
-
+            and (aired_before is None or (ep.aired is not None and ep.aired < aired_before))
             # Filter very recent episodes (within threshold hours)
-            if recent_cutoff is not None and ep.aired is not None:
-                # Convert date to datetime for comparison
-                ep_datetime = datetime(ep.aired.year, ep.aired.month, ep.aired.day, tzinfo=UTC)
-                if ep_datetime > recent_cutoff:
-                    continue
-
-            filtered.append(ep)
-
-        return filtered
+            and (recent_cutoff is None or ep.aired is None or ep.aired <= recent_cutoff)
+        ]
 
     def _find_show_gaps(
         self,
@@ -351,6 +401,11 @@ class EpisodeGapFinder:
         Returns:
             ShowGap if there are missing episodes, None otherwise.
         """
+        # Fast path: nothing missing (the common case for a complete show).
+        # A single set comparison replaces the per-season walk below.
+        if owned_episodes.issuperset((ep.season_number, ep.episode_number) for ep in tvdb_episodes):
+            return None
+
         # Group TVDB episodes by season
         seasons: dict[int, list[TVDBEpisode]] = {}
         for ep in tvdb_episodes:
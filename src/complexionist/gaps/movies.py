@@ -20,6 +20,29 @@ from complexionist.tmdb import (
 )
 from complexionist.utils import retry_with_backoff
 
+# Parallel TMDB lookups per scan, and the minimum spacing between uncached
+# requests across all workers. Cache hits are not throttled, so fully cached
+# scans run at full speed.
+TMDB_WORKERS = 2
+TMDB_MIN_REQUEST_INTERVAL = 0.25
+
+
+class _RequestThrottle:
+    """Space out API requests made from several worker threads."""
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._last_request = 0.0
+
+    def wait(self) -> None:
+        """Block until at least ``interval`` seconds have passed since the last request."""
+        with self._lock:
+            elapsed = time.monotonic() - self._last_request
+            if elapsed < self._interval:
+                time.sleep(self._interval - elapsed)
+            self._last_request = time.monotonic()
+
 
 class MovieGapFinder:
     """Find missing movies from collections in a Plex library."""
@@ -129,9 +152,9 @@ class MovieGapFinder:
     def _get_collection_ids(self, movies: list[PlexMovie]) -> dict[int, int]:
         """Get collection IDs for movies that belong to collections.
 
-        Uses 2 parallel workers to speed up TMDB lookups. A shared
-        rate-limit lock enforces at least 0.25s between uncached API
-        calls across all workers; cache hits skip the lock entirely,
+        Uses TMDB_WORKERS parallel workers to speed up TMDB lookups. A
+        shared throttle enforces at least TMDB_MIN_REQUEST_INTERVAL between
+        uncached API calls across all workers; cache hits skip it entirely,
         so fully cached scans run at full speed.
 
         Args:
@@ -148,22 +171,13 @@ class MovieGapFinder:
         collection_map: dict[int, int] = {}
         completed = 0
 
-        # Rate-limit lock: workers acquire this before making a real API call,
-        # ensuring at least 0.25s between uncached requests across all workers.
-        rate_lock = threading.Lock()
-        last_api_call = 0.0
+        throttle = _RequestThrottle(TMDB_MIN_REQUEST_INTERVAL)
 
         def lookup_movie(movie: PlexMovie) -> tuple[int | None, int | None, str]:
             """Look up a single movie's collection ID. Returns (tmdb_id, collection_id, title)."""
-            nonlocal last_api_call
-
             # Rate-limit only uncached lookups
             if not self.tmdb.is_movie_cached(movie.tmdb_id):  # type: ignore[arg-type]
-                with rate_lock:
-                    elapsed = time.monotonic() - last_api_call
-                    if elapsed < 0.25:
-                        time.sleep(0.25 - elapsed)
-                    last_api_call = time.monotonic()
+                throttle.wait()
 
             try:
                 collection_id = self._get_movie_collection_id(movie.tmdb_id)  # type: ignore[arg-type]
@@ -180,7 +194,7 @@ class MovieGapFinder:
                 record_skipped_item()
                 return (movie.tmdb_id, None, movie.title)
 
-        with ThreadPoolExecutor(max_workers=2) as executor:
+        with ThreadPoolExecutor(max_workers=TMDB_WORKERS) as executor:
             futures = {
                 executor.submit(lookup_movie, movie): i for i, movie in enumerate(movies_with_ids)
             }
@@ -231,119 +245,162 @@ class MovieGapFinder:
             List of collection gaps (only collections with missing movies).
         """
         # Get unique collection IDs
-        unique_collection_ids = set(movie_collections.values())
+        unique_collection_ids = list(set(movie_collections.values()))
         total = len(unique_collection_ids)
         gaps: list[CollectionGap] = []
 
-        for i, collection_id in enumerate(unique_collection_ids):
-            # Skip ignored collections (by ID)
-            if collection_id in self.ignored_collection_ids:
-                self._progress("Analyzing: (skipped)", i + 1, total)
-                continue
+        # Fetch collections on a small thread pool, throttled like the movie
+        # lookups. Results are consumed in order, so progress and the report
+        # are the same as a serial scan.
+        throttle = _RequestThrottle(TMDB_MIN_REQUEST_INTERVAL)
 
-            try:
-                collection = self._fetch_collection(collection_id)
-                self._progress(f"Analyzing: {collection.name}", i + 1, total)
-            except TMDBNotFoundError:
-                continue
-            except TMDBError as e:
-                # Log API errors and continue with next collection
-                log_error(
-                    e, self._log_context(f"TMDB API error for collection ID: {collection_id}")
-                )
-                record_skipped_item()
-                continue
-            except Exception as e:
-                # Log unexpected errors and continue
-                log_error(
-                    e,
-                    self._log_context(
-                        f"Unexpected error processing collection ID: {collection_id}"
-                    ),
-                )
-                record_skipped_item()
-                continue
+        def fetch_collection(collection_id: int) -> TMDBCollection:
+            """Fetch a single collection, rate-limiting uncached lookups."""
+            if not self.tmdb.is_collection_cached(collection_id):
+                throttle.wait()
+            return self._fetch_collection(collection_id)
 
-            # Skip excluded collections (by name)
-            if collection.name.lower() in self.excluded_collections:
-                continue
+        executor = ThreadPoolExecutor(max_workers=TMDB_WORKERS)
+        try:
+            futures = {
+                collection_id: executor.submit(fetch_collection, collection_id)
+                for collection_id in unique_collection_ids
+                if collection_id not in self.ignored_collection_ids
+            }
+            for i, collection_id in enumerate(unique_collection_ids):
+                # Skip ignored collections (by ID)
+                if collection_id not in futures:
+                    self._progress("Analyzing: (skipped)", i + 1, total)
+                    continue
+
+                try:
+                    collection = futures[collection_id].result()
+                    self._progress(f"Analyzing: {collection.name}", i + 1, total)
+                except TMDBNotFoundError:
+                    continue
+                except TMDBError as e:
+                    # Log API errors and continue with next collection
+                    log_error(
+                        e, self._log_context(f"TMDB API error for collection ID: {collection_id}")
+                    )
+                    record_skipped_item()
+                    continue
+                except Exception as e:
+                    # Log unexpected errors and continue
+                    log_error(
+                        e,
+                        self._log_context(
+                            f"Unexpected error processing collection ID: {collection_id}"
+                        ),
+                    )
+                    record_skipped_item()
+                    continue
+
+                gap = self._check_collection(
+                    collection_id, collection, owned_tmdb_ids, tmdb_to_plex, library_locations
+                )
+                if gap is not None:
+                    gaps.append(gap)
+        finally:
+            # Don't wait on queued fetches if the scan is aborted (e.g. Ctrl+C)
+            executor.shutdown(wait=True, cancel_futures=True)
 
-            # Get movies to consider (released or all if include_future)
-            if self.include_future:
-                movies_to_check = collection.parts
-            else:
-                movies_to_check = collection.released_movies
+        return gaps
 
-            # Skip small collections
-            if len(movies_to_check) < self.min_collection_size:
-                continue
+    def _check_collection(
+        self,
+        collection_id: int,
+        collection: TMDBCollection,
+        owned_tmdb_ids: set[int],
+        tmdb_to_plex: dict[int, PlexMovie],
+        library_locations: list[str],
+    ) -> CollectionGap | None:
+        """Check one collection for missing movies or disorganized files.
 
-            # Find missing movies
-            collection_movie_ids = {m.id for m in movies_to_check}
-            owned_in_collection = owned_tmdb_ids & collection_movie_ids
-            missing_ids = collection_movie_ids - owned_tmdb_ids
+        Args:
+            collection_id: TMDB collection ID.
+            collection: The collection from TMDB.
+            owned_tmdb_ids: Set of owned movie TMDB IDs.
+            tmdb_to_plex: Map of TMDB ID to PlexMovie (for file path, resolution, codec).
+            library_locations: Plex library folder paths.
 
-            if not missing_ids:
-                # Collection is complete — check if it needs organizing
-                owned_movies_list = self._build_owned_movies(
-                    movies_to_check, owned_in_collection, tmdb_to_plex
-                )
+        Returns:
+            The collection's gap, or None if there is nothing to report.
+        """
+        # Skip excluded collections (by name)
+        if collection.name.lower() in self.excluded_collections:
+            return None
 
-                gap = CollectionGap(
-                    collection_id=collection_id,
-                    collection_name=collection.name,
-                    total_movies=len(movies_to_check),
-                    owned_movies=len(owned_in_collection),
-                    poster_path=collection.poster_path,
-                    owned_movie_list=owned_movies_list,
-                    missing_movies=[],
-                    library_locations=library_locations,
-                    is_complete=True,
-                )
+        # Get movies to consider (released or all if include_future)
+        if self.include_future:
+            movies_to_check = collection.parts
+        else:
+            movies_to_check = collection.released_movies
 
-                if gap.movies_in_different_folders:
-                    gaps.append(gap)
-                continue
+        # Skip small collections
+        if len(movies_to_check) < self.min_collection_size:
+            return None
 
-            # Skip collections where user doesn't own enough movies
-            # (prevents noise from single-movie matches)
-            if len(owned_in_collection) < self.min_owned:
-                continue
+        # Find missing movies
+        collection_movie_ids = {m.id for m in movies_to_check}
+        owned_in_collection = owned_tmdb_ids & collection_movie_ids
+        missing_ids = collection_movie_ids - owned_tmdb_ids
 
-            # Build owned movie list
+        if not missing_ids:
+            # Collection is complete — check if it needs organizing
             owned_movies_list = self._build_owned_movies(
                 movies_to_check, owned_in_collection, tmdb_to_plex
             )
 
-            # Build missing movie list
-            missing_movies = [
-                MissingMovie(
-                    tmdb_id=m.id,
-                    title=m.title,
-                    release_date=m.release_date,
-                    year=m.year,
-                )
-                for m in movies_to_check
-                if m.id in missing_ids
-            ]
-
-            # Sort by release date (oldest first)
-            missing_movies.sort(key=lambda m: m.release_date or date(9999, 12, 31))
-
-            gaps.append(
-                CollectionGap(
-                    collection_id=collection_id,
-                    collection_name=collection.name,
-                    total_movies=len(movies_to_check),
-                    owned_movies=len(owned_in_collection),
-                    poster_path=collection.poster_path,
-                    owned_movie_list=owned_movies_list,
-                    missing_movies=missing_movies,
-                    library_locations=library_locations,
-                )
+            gap = CollectionGap(
+                collection_id=collection_id,
+                collection_name=collection.name,
+                total_movies=len(movies_to_check),
+                owned_movies=len(owned_in_collection),
+                poster_path=collection.poster_path,
+                owned_movie_list=owned_movies_list,
+                missing_movies=[],
+                library_locations=library_locations,
+                is_complete=True,
             )
 
-        return gaps
+            return gap if gap.movies_in_different_folders else None
+
+        # Skip collections where user doesn't own enough movies
+        # (prevents noise from single-movie matches)
+        if len(owned_in_collection) < self.min_owned:
+            return None
+
+        # Build owned movie list
+        owned_movies_list = self._build_owned_movies(
+            movies_to_check, owned_in_collection, tmdb_to_plex
+        )
+
+        # Build missing movie list
+        missing_movies = [
+            MissingMovie(
+                tmdb_id=m.id,
+                title=m.title,
+                release_date=m.release_date,
+                year=m.year,
+            )
+            for m in movies_to_check
+            if m.id in missing_ids
+        ]
+
+        # Sort by release date (oldest first)
+        missing_movies.sort(key=lambda m: m.release_date or date(9999, 12, 31))
+
+        return CollectionGap(
+            collection_id=collection_id,
+            collection_name=collection.name,
+            total_movies=len(movies_to_check),
+            owned_movies=len(owned_in_collection),
+            poster_path=collection.poster_path,
+            owned_movie_list=owned_movies_list,
+            missing_movies=missing_movies,
+            library_locations=library_locations,
+        )
 
     @staticmethod
     def _build_owned_movies(
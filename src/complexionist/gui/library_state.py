@@ -37,7 +37,7 @@ def load_library_selection() -> LibrarySelection:
         return LibrarySelection()
 
     try:
-        parser = configparser.ConfigParser()
+        parser = configparser.ConfigParser(interpolation=None)
         parser.read(config_path, encoding="utf-8")
 
         if "libraries" not in parser:
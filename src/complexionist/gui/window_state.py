@@ -47,7 +47,7 @@ def load_window_state() -> WindowState:
         return WindowState()
 
     try:
-        parser = configparser.ConfigParser()
+        parser = configparser.ConfigParser(interpolation=None)
         parser.read(config_path, encoding="utf-8")
 
         if "window" not in parser:
@@ -83,7 +83,7 @@ def save_window_state(state: WindowState) -> bool:
         return False
 
     try:
-        parser = configparser.ConfigParser()
+        parser = configparser.ConfigParser(interpolation=None)
         parser.read(config_path, encoding="utf-8")
 
         # Create or update window section
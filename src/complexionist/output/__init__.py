@@ -12,12 +12,22 @@ import json
 from abc import ABC, abstractmethod
 from datetime import date
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TextIO
 
 from rich.console import Console
+from rich.markup import escape
+from rich.text import Text
 
 from complexionist.constants import get_score_rating
 
+# Optional fast JSON encoder (pip install complexionist[json])
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 if TYPE_CHECKING:
     from complexionist.gaps.models import EpisodeGapReport, MovieGapReport
     from complexionist.statistics import ScanStatistics
@@ -26,6 +36,18 @@ if TYPE_CHECKING:
 console = Console()
 
 
+def _iso(value: date | None) -> str | None:
+    """Format an optional date as ISO 8601 for JSON/CSV output."""
+    return value.isoformat() if value else None
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a report dict to indented JSON, using orjson when installed."""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
 class ReportFormatter(ABC):
     """Abstract base class for report formatting."""
 
@@ -35,9 +57,15 @@ class ReportFormatter(ABC):
         pass
 
     @abstractmethod
+    def write_csv(self, stream: TextIO, lineterminator: str = "\r\n") -> None:
+        """Write report rows as CSV to an open text stream."""
+        pass
+
     def to_csv(self) -> str:
         """Convert report to CSV string."""
-        pass
+        output = io.StringIO()
+        self.write_csv(output)
+        return output.getvalue()
 
     @abstractmethod
     def to_text(self, verbose: bool = False) -> None:
@@ -96,6 +124,16 @@ class ReportFormatter(ABC):
 
         return " | ".join(parts) if parts else ""
 
+    @staticmethod
+    def _print_lines(lines: list[str | Text]) -> None:
+        """Print report lines to the console in a single call.
+
+        Strings are parsed as markup; per-item rows are passed as plain
+        Text so user-supplied titles skip the markup parser entirely.
+        """
+        rendered = (console.render_str(line) if isinstance(line, str) else line for line in lines)
+        console.print(Text("\n").join(rendered))
+
     @staticmethod
     def _print_skipped_warning(stats: ScanStatistics) -> None:
         """Warn when per-item API failures made the report incomplete."""
@@ -134,7 +172,7 @@ class MovieReportFormatter(ReportFormatter):
                             "tmdb_id": m.tmdb_id,
                             "title": m.title,
                             "year": m.year,
-                            "release_date": m.release_date.isoformat() if m.release_date else None,
+                            "release_date": _iso(m.release_date),
                             "url": m.tmdb_url,
                         }
                         for m in gap.missing_movies
@@ -143,12 +181,11 @@ class MovieReportFormatter(ReportFormatter):
                 for gap in self.report.collections_with_gaps
             ],
         }
-        return json.dumps(output, indent=2)
+        return _dumps(output)
 
-    def to_csv(self) -> str:
-        """Convert movie gap report to CSV string."""
-        output = io.StringIO()
-        writer = csv.writer(output)
+    def write_csv(self, stream: TextIO, lineterminator: str = "\r\n") -> None:
+        """Write movie gap report rows as CSV to a text stream."""
+        writer = csv.writer(stream, lineterminator=lineterminator)
         writer.writerow(
             ["Collection", "Movie Title", "Year", "TMDB ID", "Release Date", "TMDB URL"]
         )
@@ -161,68 +198,69 @@ class MovieReportFormatter(ReportFormatter):
                         movie.title,
                         movie.year or "",
                         movie.tmdb_id,
-                        movie.release_date.isoformat() if movie.release_date else "",
+                        _iso(movie.release_date) or "",
                         movie.tmdb_url,
                     ]
                 )
 
-        return output.getvalue()
-
     def to_text(self, verbose: bool = False) -> None:
         """Output movie gap report as formatted text."""
-        console.print()
-        console.print(f"[bold blue]Movie Collection Gaps - {self.report.library_name}[/bold blue]")
-        console.print()
-
-        # Summary
-        console.print(f"[dim]Movies scanned:[/dim] {self.report.total_movies_scanned}")
-        console.print(f"[dim]With TMDB ID:[/dim] {self.report.movies_with_tmdb_id}")
-        console.print(f"[dim]In collections:[/dim] {self.report.movies_in_collections}")
-        console.print(f"[dim]Unique collections:[/dim] {self.report.unique_collections}")
-        console.print()
+        # Build the whole report and print it once instead of line by line
+        lines: list[str | Text] = [
+            "",
+            f"[bold blue]Movie Collection Gaps - {escape(self.report.library_name)}[/bold blue]",
+            "",
+            f"[dim]Movies scanned:[/dim] {self.report.total_movies_scanned}",
+            f"[dim]With TMDB ID:[/dim] {self.report.movies_with_tmdb_id}",
+            f"[dim]In collections:[/dim] {self.report.movies_in_collections}",
+            f"[dim]Unique collections:[/dim] {self.report.unique_collections}",
+            "",
+        ]
 
         if not self.report.collections_with_gaps:
-            console.print("[green]All collections are complete![/green]")
+            lines.append("[green]All collections are complete![/green]")
+            self._print_lines(lines)
             return
 
         incomplete = [g for g in self.report.collections_with_gaps if not g.is_complete]
         disorganized = [g for g in self.report.collections_with_gaps if g.is_complete]
 
         if incomplete:
-            console.print(
+            lines.append(
                 f"[yellow]Found {self.report.total_missing} missing movies in "
                 f"{len(incomplete)} collections[/yellow]"
             )
         if disorganized:
-            console.print(
+            lines.append(
                 f"[orange3]{len(disorganized)} complete collections need organizing[/orange3]"
             )
-        console.print()
+        lines.append("")
 
         for gap in self.report.collections_with_gaps:
+            name = escape(gap.collection_name)
             if gap.is_complete:
-                console.print(
-                    f"[bold]{gap.collection_name}[/bold] "
+                lines.append(
+                    f"[bold]{name}[/bold] "
                     f"[orange3](complete {gap.owned_movies} of {gap.total_movies})[/orange3]"
                 )
             else:
-                console.print(
-                    f"[bold]{gap.collection_name}[/bold] "
-                    f"(missing {gap.missing_count} of {gap.total_movies})"
+                lines.append(
+                    f"[bold]{name}[/bold] (missing {gap.missing_count} of {gap.total_movies})"
                 )
 
                 max_display = 5 if not verbose else len(gap.missing_movies)
-                displayed = gap.missing_movies[:max_display]
-
-                for movie in displayed:
-                    year_str = f" ({movie.year})" if movie.year else ""
-                    console.print(f"  - {movie.title}{year_str}")
+                lines.extend(
+                    Text(f"  - {movie.title}" + (f" ({movie.year})" if movie.year else ""))
+                    for movie in gap.missing_movies[:max_display]
+                )
 
                 remaining = len(gap.missing_movies) - max_display
                 if remaining > 0:
-                    console.print(f"  [dim]... and {remaining} more[/dim]")
+                    lines.append(f"  [dim]... and {remaining} more[/dim]")
 
-            console.print()
+            lines.append("")
+
+        self._print_lines(lines)
 
     def save_csv(self) -> Path:
         """Save movie gap report as CSV file."""
@@ -231,7 +269,7 @@ class MovieReportFormatter(ReportFormatter):
         filepath = Path.cwd() / filename
 
         with open(filepath, "w", newline="", encoding="utf-8") as f:
-            f.write(self.to_csv())
+            self.write_csv(f)
 
         return filepath
 
@@ -339,7 +377,7 @@ class TVReportFormatter(ReportFormatter):
                                     "tvdb_id": ep.tvdb_id,
                                     "episode_code": ep.episode_code,
                                     "title": ep.title,
-                                    "aired": ep.aired.isoformat() if ep.aired else None,
+                                    "aired": _iso(ep.aired),
                                 }
                                 for ep in season.missing_episodes
                             ],
@@ -350,12 +388,11 @@ class TVReportFormatter(ReportFormatter):
                 for show in self.report.shows_with_gaps
             ],
         }
-        return json.dumps(output, indent=2)
+        return _dumps(output)
 
-    def to_csv(self) -> str:
-        """Convert episode gap report to CSV string."""
-        output = io.StringIO()
-        writer = csv.writer(output)
+    def write_csv(self, stream: TextIO, lineterminator: str = "\r\n") -> None:
+        """Write episode gap report rows as CSV to a text stream."""
+        writer = csv.writer(stream, lineterminator=lineterminator)
         writer.writerow(
             [
                 "Show",
@@ -383,56 +420,57 @@ class TVReportFormatter(ReportFormatter):
                             ep.episode_code,
                             ep.title or "",
                             ep.tvdb_id,
-                            ep.aired.isoformat() if ep.aired else "",
+                            _iso(ep.aired) or "",
                             show_url,
                         ]
                     )
 
-        return output.getvalue()
-
     def to_text(self, verbose: bool = False) -> None:
         """Output episode gap report as formatted text."""
-        console.print()
-        console.print(f"[bold blue]TV Episode Gaps - {self.report.library_name}[/bold blue]")
-        console.print()
-
-        # Summary
-        console.print(f"[dim]Shows scanned:[/dim] {self.report.total_shows_scanned}")
-        console.print(f"[dim]With TVDB ID:[/dim] {self.report.shows_with_tvdb_id}")
-        console.print(f"[dim]Episodes owned:[/dim] {self.report.total_episodes_owned}")
-        console.print()
+        # Build the whole report and print it once instead of line by line
+        lines: list[str | Text] = [
+            "",
+            f"[bold blue]TV Episode Gaps - {escape(self.report.library_name)}[/bold blue]",
+            "",
+            f"[dim]Shows scanned:[/dim] {self.report.total_shows_scanned}",
+            f"[dim]With TVDB ID:[/dim] {self.report.shows_with_tvdb_id}",
+            f"[dim]Episodes owned:[/dim] {self.report.total_episodes_owned}",
+            "",
+        ]
 
         if not self.report.shows_with_gaps:
-            console.print("[green]All shows are complete![/green]")
+            lines.append("[green]All shows are complete![/green]")
+            self._print_lines(lines)
             return
 
-        console.print(
+        lines.append(
             f"[yellow]Found {self.report.total_missing} missing episodes in "
             f"{len(self.report.shows_with_gaps)} shows[/yellow]"
         )
-        console.print()
+        lines.append("")
 
         for show in self.report.shows_with_gaps:
-            console.print(
-                f"[bold]{show.display_title}[/bold] "
+            lines.append(
+                f"[bold]{escape(show.display_title)}[/bold] "
                 f"({show.owned_episodes}/{show.total_episodes} - {show.completion_percent:.0f}%)"
             )
 
             for season in show.seasons_with_gaps:
-                console.print(f"  [dim]Season {season.season_number}:[/dim]")
+                lines.append(f"  [dim]Season {season.season_number}:[/dim]")
 
                 max_display = 5 if not verbose else len(season.missing_episodes)
-                displayed = season.missing_episodes[:max_display]
-
-                for ep in displayed:
-                    title_part = f" - {ep.title}" if ep.title else ""
-                    console.print(f"    {ep.episode_code}{title_part}")
+                lines.extend(
+                    Text(f"    {ep.episode_code}" + (f" - {ep.title}" if ep.title else ""))
+                    for ep in season.missing_episodes[:max_display]
+                )
 
                 remaining = len(season.missing_episodes) - max_display
                 if remaining > 0:
-                    console.print(f"    [dim]... and {remaining} more[/dim]")
+                    lines.append(f"    [dim]... and {remaining} more[/dim]")
 
-            console.print()
+            lines.append("")
+
+        self._print_lines(lines)
 
     def save_csv(self) -> Path:
         """Save episode gap report as CSV file."""
@@ -441,7 +479,7 @@ class TVReportFormatter(ReportFormatter):
         filepath = Path.cwd() / filename
 
         with open(filepath, "w", newline="", encoding="utf-8") as f:
-            f.write(self.to_csv())
+            self.write_csv(f)
 
         return filepath
 
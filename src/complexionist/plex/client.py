@@ -1,6 +1,7 @@
 """Plex Media Server client."""
 
 import re
+import threading
 from collections.abc import Callable
 from urllib.parse import urlparse
 
@@ -139,6 +140,14 @@ class PlexClient:
 
         self._timeout = timeout
         self._server: PlexServer | None = None
+        self._server_thread: int | None = None
+
+        # Connections for scan worker threads. plexapi objects share their
+        # PlexServer's requests.Session, which is not documented as
+        # thread-safe, so each worker thread gets a connection of its own.
+        self._thread_local = threading.local()
+        self._worker_servers: list[PlexServer] = []
+        self._worker_servers_lock = threading.Lock()
 
     def _normalize_url(self, url: str) -> str:
         """Normalize the Plex server URL."""
@@ -152,12 +161,22 @@ class PlexClient:
     def connect(self) -> None:
         """Connect to the Plex server.
 
+        Raises:
+            PlexAuthError: If authentication fails.
+            PlexConnectionError: If connection fails.
+        """
+        self._server = self._open_server()
+        self._server_thread = threading.get_ident()
+
+    def _open_server(self) -> PlexServer:
+        """Open a new connection (and session) to the Plex server.
+
         Raises:
             PlexAuthError: If authentication fails.
             PlexConnectionError: If connection fails.
         """
         try:
-            self._server = PlexServer(self.url, self.token, timeout=self._timeout)
+            return PlexServer(self.url, self.token, timeout=self._timeout)
         except Unauthorized as e:
             raise PlexAuthError(f"Invalid Plex token: {e}") from e
         except Exception as e:
@@ -171,6 +190,23 @@ class PlexClient:
         assert self._server is not None  # connect() sets this
         return self._server
 
+    def _thread_server(self) -> PlexServer:
+        """Get a server connection owned by the calling thread.
+
+        The thread that connected uses the main connection; any other thread
+        opens its own on first use, kept until close().
+        """
+        if self._server is None or self._server_thread == threading.get_ident():
+            return self.server
+
+        server: PlexServer | None = getattr(self._thread_local, "server", None)
+        if server is None:
+            server = self._open_server()
+            self._thread_local.server = server
+            with self._worker_servers_lock:
+                self._worker_servers.append(server)
+        return server
+
     @property
     def server_name(self) -> str:
         """Get the server's friendly name."""
@@ -184,12 +220,16 @@ class PlexClient:
         self.close()
 
     def close(self) -> None:
-        """Close the Plex server connection and release resources."""
-        if self._server is not None and hasattr(self._server, "_session"):
-            try:
-                self._server._session.close()  # noqa: SLF001  # plexapi internal
-            except Exception:
-                pass
+        """Close the Plex server connections and release resources."""
+        with self._worker_servers_lock:
+            servers = [self._server, *self._worker_servers]
+            self._worker_servers.clear()
+        for server in servers:
+            if server is not None and hasattr(server, "_session"):
+                try:
+                    server._session.close()  # noqa: SLF001  # plexapi internal
+                except Exception:
+                    pass
 
     @staticmethod
     def _record_plex_api_call() -> None:
@@ -396,6 +436,8 @@ class PlexClient:
     def get_episodes(self, show_rating_key: str) -> list[PlexEpisode]:
         """Get all episodes for a TV show.
 
+        Safe to call from worker threads: each thread uses its own connection.
+
         Args:
             show_rating_key: The rating key of the TV show.
 
@@ -405,7 +447,7 @@ class PlexClient:
         self._record_plex_api_call()
 
         try:
-            show = self.server.fetchItem(int(show_rating_key))
+            show = self._thread_server().fetchItem(int(show_rating_key))
         except (NotFound, BadRequest) as e:
             raise PlexNotFoundError(f"Show not found: {show_rating_key}") from e
 
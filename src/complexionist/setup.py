@@ -7,7 +7,12 @@ from pathlib import Path
 from rich.console import Console
 from rich.prompt import Confirm, Prompt
 
-from complexionist.config import find_config_file, reset_config, save_default_config
+from complexionist.config import (
+    find_config_file,
+    get_config_path,
+    reset_config,
+    save_default_config,
+)
 
 console = Console()
 
@@ -233,6 +238,10 @@ def detect_first_run() -> bool:
     Returns:
         True if no config file was found, False otherwise.
     """
+    # Config already loaded from a file this process (e.g. scan's second
+    # subcommand): no need to walk the search paths again
+    if get_config_path() is not None:
+        return False
     return find_config_file() is None
 
 
@@ -104,6 +104,21 @@ class TMDBClient(BaseAPIClient):
             return False
         return self._cache.get("tmdb", "movies", str(tmdb_id)) is not None
 
+    def is_collection_cached(self, collection_id: int) -> bool:
+        """Check whether a collection is already in the cache.
+
+        Uses the same cache key as :meth:`get_collection`.
+
+        Args:
+            collection_id: The TMDB collection ID.
+
+        Returns:
+            True if the collection is cached (and not expired), False otherwise.
+        """
+        if self._cache is None:
+            return False
+        return self._cache.get("tmdb", "collections", str(collection_id)) is not None
+
     def get_movie(self, movie_id: int) -> TMDBMovieDetails:
         """Get movie details including collection membership.
 
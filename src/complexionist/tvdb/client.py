@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import threading
+from typing import TYPE_CHECKING, Any
 
 import httpx
 from pydantic import ValidationError
@@ -91,22 +92,34 @@ class TVDBClient(BaseAPIClient):
 
         self._timeout = timeout
         self._token: str | None = None
+        # Scans call the client from worker threads; this serializes login and
+        # client creation so concurrent first calls authenticate only once.
+        self._auth_lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        """Return the HTTP client, re-authenticating if a 401 dropped it."""
+        return self._get_client()
 
     def _get_client(self) -> httpx.Client:
         """Get or create the HTTP client with auth token."""
-        if self._client is None:
-            if self._token is None:
-                self._login()
-
-            self._client = httpx.Client(
-                base_url=self.BASE_URL,
-                timeout=self._timeout,
-                headers={
-                    "Accept": "application/json",
-                    "Authorization": f"Bearer {self._token}",
-                },
-            )
-        return self._client
+        client = self._client
+        if client is None:
+            with self._auth_lock:
+                if self._client is None:
+                    if self._token is None:
+                        self._login()
+
+                    self._client = httpx.Client(
+                        base_url=self.BASE_URL,
+                        timeout=self._timeout,
+                        headers={
+                            "Accept": "application/json",
+                            "Authorization": f"Bearer {self._token}",
+                        },
+                    )
+                client = self._client
+        return client
 
     def login(self) -> None:
         """Authenticate and get a Bearer token.
@@ -118,7 +131,8 @@ class TVDBClient(BaseAPIClient):
             TVDBAuthError: If the API key is invalid.
             TVDBError: If login fails.
         """
-        self._login()
+        with self._auth_lock:
+            self._login()
 
     def _login(self) -> None:
         """Authenticate and get a Bearer token (internal).
@@ -151,8 +165,9 @@ class TVDBClient(BaseAPIClient):
 
     def _on_auth_failure(self) -> None:
         """Clear token on 401 so re-auth is attempted on next request."""
-        self._token = None
-        self._client = None
+        with self._auth_lock:
+            self._token = None
+            self._client = None
 
     def get_series(self, series_id: int) -> TVDBSeries:
         """Get basic series information.
@@ -163,8 +178,6 @@ class TVDBClient(BaseAPIClient):
         Returns:
             Series information.
         """
-        from complexionist.cache import TVDB_SERIES_ENDED_TTL_HOURS, TVDB_SERIES_TTL_HOURS
-
         cache_key = str(series_id)
 
         # Check cache first
@@ -181,41 +194,9 @@ class TVDBClient(BaseAPIClient):
         response = self._get(f"/series/{series_id}")
         data = self._handle_response(response)
 
-        series_data = data.get("data", {})
-
-        try:
-            series = TVDBSeries(
-                id=series_data["id"],
-                name=series_data["name"],
-                slug=series_data.get("slug"),
-                status=series_data.get("status", {}).get("name")
-                if series_data.get("status")
-                else None,
-                firstAired=self._parse_date(series_data.get("firstAired")),
-                year=series_data.get("year"),
-                image=series_data.get("image"),
-            )
-
-            # Store in cache with TTL based on show status
-            # Ended/cancelled shows rarely change, so use longer TTL (1 year)
-            if self._cache:
-                ttl_hours = (
-                    TVDB_SERIES_ENDED_TTL_HOURS
-                    if _is_ended_status(series.status)
-                    else TVDB_SERIES_TTL_HOURS
-                )
-                self._cache.set(
-                    "tvdb",
-                    "series",
-                    cache_key,
-                    series.model_dump(mode="json"),
-                    ttl_hours=ttl_hours,
-                    description=f"Series: {series.name}",
-                )
-
-            return series
-        except (ValidationError, KeyError) as e:
-            raise TVDBError(f"Failed to parse series response: {e}") from e
+        series = self._parse_series(data.get("data", {}))
+        self._cache_series(series)
+        return series
 
     def get_series_episodes(
         self,
@@ -237,8 +218,6 @@ class TVDBClient(BaseAPIClient):
         Returns:
             List of all episodes.
         """
-        from complexionist.cache import TVDB_EPISODES_ENDED_TTL_HOURS, TVDB_EPISODES_TTL_HOURS
-
         # Build cache key including season_type
         cache_key = f"{series_id}_{season_type}"
 
@@ -267,21 +246,7 @@ class TVDBClient(BaseAPIClient):
             if not episodes_data:
                 break
 
-            for ep_data in episodes_data:
-                try:
-                    episode = TVDBEpisode(
-                        id=ep_data["id"],
-                        seriesId=ep_data.get("seriesId", series_id),
-                        name=ep_data.get("name"),
-                        seasonNumber=ep_data.get("seasonNumber", 0),
-                        number=ep_data.get("number", 0),
-                        aired=self._parse_date(ep_data.get("aired")),
-                        runtime=ep_data.get("runtime"),
-                    )
-                    all_episodes.append(episode)
-                except (ValidationError, KeyError):
-                    # Skip malformed episodes but continue processing
-                    continue
+            all_episodes.extend(self._parse_episodes(episodes_data, series_id))
 
             # Check if there are more pages
             # TVDB returns empty episodes list when no more pages
@@ -290,9 +255,127 @@ class TVDBClient(BaseAPIClient):
 
             page += 1
 
-        # Store in cache with TTL based on show status
+        self._cache_episodes(series_id, all_episodes, series_status, season_type)
+        return all_episodes
+
+    def get_series_with_episodes(self, series_id: int) -> tuple[TVDBSeries, list[TVDBEpisode]]:
+        """Get series information and all default-order episodes in one request.
+
+        Uses the extended series endpoint, so a show costs a single round trip
+        instead of one for the series and one per episode page. Results are
+        cached under the same keys as get_series() and get_series_episodes().
+
+        Args:
+            series_id: The TVDB series ID.
+
+        Returns:
+            Tuple of (series information, list of all episodes).
+        """
+        # Check cache first - only skip the request if both halves are cached
+        if self._cache:
+            cached_series = self._cache.get("tvdb", "series", str(series_id))
+            cached_episodes = self._cache.get("tvdb", "episodes", f"{series_id}_default")
+            if cached_series and cached_episodes and "episodes" in cached_episodes:
+                self._record_cache_hit("tvdb")
+                return (
+                    TVDBSeries.model_validate(cached_series),
+                    [TVDBEpisode.model_validate(ep) for ep in cached_episodes["episodes"]],
+                )
+
+        # Cache miss - making API call
+        self._record_cache_miss("tvdb", "tvdb_series")
+
+        self._get_client()
+        response = self._get(
+            f"/series/{series_id}/extended",
+            params={"meta": "episodes", "short": "true"},
+        )
+        data = self._handle_response(response)
+
+        series_data = data.get("data", {})
+        series = self._parse_series(series_data)
+        episodes = self._parse_episodes(series_data.get("episodes") or [], series_id)
+
+        self._cache_series(series)
+        self._cache_episodes(series_id, episodes, series.status)
+
+        return series, episodes
+
+    def _parse_series(self, series_data: dict[str, Any]) -> TVDBSeries:
+        """Build a TVDBSeries from a series (or extended series) record.
+
+        Raises:
+            TVDBError: If the record is missing required fields.
+        """
+        try:
+            return TVDBSeries(
+                id=series_data["id"],
+                name=series_data["name"],
+                slug=series_data.get("slug"),
+                status=series_data.get("status", {}).get("name")
+                if series_data.get("status")
+                else None,
+                firstAired=self._parse_date(series_data.get("firstAired")),
+                year=series_data.get("year"),
+                image=series_data.get("image"),
+            )
+        except (ValidationError, KeyError) as e:
+            raise TVDBError(f"Failed to parse series response: {e}") from e
+
+    def _parse_episodes(
+        self, episodes_data: list[dict[str, Any]], series_id: int
+    ) -> list[TVDBEpisode]:
+        """Build TVDBEpisodes from episode records, skipping malformed ones."""
+        episodes: list[TVDBEpisode] = []
+        for ep_data in episodes_data:
+            try:
+                episode = TVDBEpisode(
+                    id=ep_data["id"],
+                    seriesId=ep_data.get("seriesId", series_id),
+                    name=ep_data.get("name"),
+                    seasonNumber=ep_data.get("seasonNumber", 0),
+                    number=ep_data.get("number", 0),
+                    aired=self._parse_date(ep_data.get("aired")),
+                    runtime=ep_data.get("runtime"),
+                )
+                episodes.append(episode)
+            except (ValidationError, KeyError):
+                # Skip malformed episodes but continue processing
+                continue
+        return episodes
+
+    def _cache_series(self, series: TVDBSeries) -> None:
+        """Store series info in the cache with a TTL based on show status."""
+        from complexionist.cache import TVDB_SERIES_ENDED_TTL_HOURS, TVDB_SERIES_TTL_HOURS
+
+        # Ended/cancelled shows rarely change, so use longer TTL (1 year)
+        if self._cache:
+            ttl_hours = (
+                TVDB_SERIES_ENDED_TTL_HOURS
+                if _is_ended_status(series.status)
+                else TVDB_SERIES_TTL_HOURS
+            )
+            self._cache.set(
+                "tvdb",
+                "series",
+                str(series.id),
+                series.model_dump(mode="json"),
+                ttl_hours=ttl_hours,
+                description=f"Series: {series.name}",
+            )
+
+    def _cache_episodes(
+        self,
+        series_id: int,
+        episodes: list[TVDBEpisode],
+        series_status: str | None,
+        season_type: str = "default",
+    ) -> None:
+        """Store a series' episodes in the cache with a TTL based on show status."""
+        from complexionist.cache import TVDB_EPISODES_ENDED_TTL_HOURS, TVDB_EPISODES_TTL_HOURS
+
         # Ended/cancelled shows won't get new episodes, use longer TTL (1 year)
-        if self._cache and all_episodes:
+        if self._cache and episodes:
             ttl_hours = (
                 TVDB_EPISODES_ENDED_TTL_HOURS
                 if _is_ended_status(series_status)
@@ -301,14 +384,12 @@ class TVDBClient(BaseAPIClient):
             self._cache.set(
                 "tvdb",
                 "episodes",
-                cache_key,
-                {"episodes": [ep.model_dump(mode="json") for ep in all_episodes]},
+                f"{series_id}_{season_type}",
+                {"episodes": [ep.model_dump(mode="json") for ep in episodes]},
                 ttl_hours=ttl_hours,
-                description=f"Series {series_id} ({len(all_episodes)} episodes)",
+                description=f"Series {series_id} ({len(episodes)} episodes)",
             )
 
-        return all_episodes
-
     def test_connection(self) -> bool:
         """Test the API connection and key validity.
 
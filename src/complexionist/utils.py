@@ -23,7 +23,16 @@ def is_date_past(d: date | None) -> bool:
     """
     if d is None:
         return False
-    return d < date.today() - timedelta(days=1)
+    return d < past_date_cutoff()
+
+
+def past_date_cutoff() -> date:
+    """Get the date that ``is_date_past`` compares against.
+
+    A date counts as past when it is strictly before this one. Loops over
+    many dates can fetch it once instead of calling ``is_date_past`` per item.
+    """
+    return date.today() - timedelta(days=1)
 
 
 def retry_with_backoff(
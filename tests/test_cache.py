@@ -315,6 +315,21 @@ class TestCacheVersioning:
         fresh = Cache(cache_dir=tmp_path)
         assert fresh.get("tmdb", "movies", "123") == {"id": 123}
 
+    def test_flush_without_changes_does_not_write(self, tmp_path: Path) -> None:
+        """A warm scan with no cache writes leaves the cache file untouched."""
+        cache = Cache(cache_dir=tmp_path)
+        cache.set("tmdb", "movies", "1", {"id": 1}, ttl_hours=1)
+        cache.flush()
+        cache_file = tmp_path / "complexionist.cache.json"
+        mtime = cache_file.stat().st_mtime_ns
+
+        fresh = Cache(cache_dir=tmp_path)
+        assert fresh.get("tmdb", "movies", "1") == {"id": 1}
+        fresh.flush()
+
+        assert fresh.pending_changes == 0
+        assert cache_file.stat().st_mtime_ns == mtime
+
 
 class TestCacheDelete:
     """Tests for Cache delete operation."""
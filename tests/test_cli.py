@@ -1,21 +1,25 @@
 """Tests for the CLI module."""
 
+import csv
+import io
+import json
 import re
 from collections.abc import Iterator
 from datetime import date
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 from click.testing import CliRunner
+from rich.console import Console
 
 from complexionist import __version__
-from complexionist.cli import main
+from complexionist.cli import _scan_progress, main
 from complexionist.config import reset_config
 from complexionist.gaps import EpisodeGapReport, MovieGapReport
 from complexionist.plex import PlexEpisode, PlexError, PlexMovie, PlexShow
 from complexionist.tmdb import TMDBCollection, TMDBError, TMDBMovie, TMDBMovieDetails
-from complexionist.tvdb import TVDBEpisode
+from complexionist.tvdb import TVDBEpisode, TVDBError
 
 VALID_INI = """\
 [plex:0]
@@ -121,13 +125,13 @@ def _mock_plex_with_shows(
 def _mock_tvdb(episodes_by_series: dict[int, list[TVDBEpisode]]) -> MagicMock:
     """Mock TVDBClient backed by static episode data."""
     client = MagicMock()
-    client.get_series_episodes.side_effect = lambda series_id, series_status=None: (
-        episodes_by_series.get(series_id, [])
-    )
     series = MagicMock()
     series.image = "https://example.com/poster.jpg"
     series.status = "Continuing"
-    client.get_series.return_value = series
+    client.get_series_with_episodes.side_effect = lambda series_id: (
+        series,
+        episodes_by_series.get(series_id, []),
+    )
     client.test_connection.return_value = True
     return client
 
@@ -175,6 +179,76 @@ def test_version() -> None:
     assert __version__ in result.output
 
 
+def test_cli_import_stays_lightweight() -> None:
+    """Importing the CLI (the --help/--version path) must not pull in heavy deps."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, complexionist.cli; "
+        "heavy = ('pydantic', 'httpx', 'plexapi', 'flet', 'complexionist.config'); "
+        "print(sorted(m for m in sys.modules if m.split('.')[0] in heavy or m in heavy))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_splash_is_plain_when_redirected() -> None:
+    """Non-terminal output gets the unstyled splash without the Rich panel."""
+    runner = CliRunner()
+    result = runner.invoke(main, ["--help"])
+    assert result.exit_code == 0
+    assert "Completing your Plex Media Server libraries" in result.output
+    assert "\x1b[" not in result.output
+    assert "╭" not in result.output
+
+
+class TestPrefetch:
+    """Tests for the background import prefetch behind the splash."""
+
+    def test_prefetch_imports_scan_modules(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import sys
+
+        import complexionist.cli as cli_module
+
+        monkeypatch.setattr(cli_module, "_prefetch_thread", None)
+        cli_module._start_prefetch()
+        cli_module._finish_prefetch()
+
+        assert all(name in sys.modules for name in cli_module._PREFETCH_MODULES)
+
+    def test_help_does_not_prefetch(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import complexionist.cli as cli_module
+
+        monkeypatch.setattr(cli_module, "_prefetch_thread", None)
+        result = CliRunner().invoke(main, ["movies", "--help"])
+
+        assert result.exit_code == 0
+        assert cli_module._prefetch_thread is None
+
+
+def test_gui_launch_skips_config_and_scan_modules() -> None:
+    """The default GUI path hands off to run_app without loading config/API modules."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, complexionist.gui as gui\n"
+        "heavy = ('complexionist.config', 'complexionist.plex', 'pydantic', 'httpx')\n"
+        "gui.run_app = lambda web_mode=False: print(sorted(m for m in heavy if m in sys.modules))\n"
+        "from complexionist.cli import main\n"
+        "main([], standalone_mode=False)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
 def test_movies_command_exists() -> None:
     """Test that the movies command exists."""
     runner = CliRunner()
@@ -207,6 +281,17 @@ def test_config_path() -> None:
     assert ".complexionist" in result.output
 
 
+def test_config_path_marks_active_file(config_env: Path) -> None:
+    """config path flags the first existing config file as active."""
+    runner = CliRunner()
+    result = runner.invoke(main, ["config", "path"])
+    assert result.exit_code == 0
+    # Long tmp paths may wrap at the console width
+    output = result.output.replace("\n", "")
+    assert output.count("(active)") == 1
+    assert f"{config_env / 'complexionist.ini'} (active)" in output
+
+
 class TestMoviesCommand:
     """Tests for the movies command with mocked API clients."""
 
@@ -245,6 +330,107 @@ class TestMoviesCommand:
         # JSON mode does not write a CSV file
         assert not list(config_env.glob("*_movie_gaps_*.csv"))
 
+    def test_json_format_writes_encoded_report_verbatim(self, config_env: Path) -> None:
+        """--format json writes the formatter's JSON to stdout without re-encoding."""
+        plex, tmdb = _movie_scan_mocks()
+        runner = CliRunner()
+        encoded: list[str] = []
+
+        def compact_dumps(obj: object) -> str:
+            encoded.append(json.dumps(obj, separators=(",", ":")))
+            return encoded[-1]
+
+        with (
+            patch("complexionist.plex.PlexClient", return_value=plex),
+            patch("complexionist.tmdb.TMDBClient", return_value=tmdb),
+            patch("complexionist.output._dumps", side_effect=compact_dumps),
+        ):
+            result = runner.invoke(main, ["movies", "--format", "json"])
+
+        assert result.exit_code == 0
+        assert len(encoded) == 1
+        # stdout is the report alone, byte for byte; the splash goes to stderr
+        assert result.stdout == encoded[0] + "\n"
+        assert json.loads(result.stdout)["library_name"] == "Movies"
+        assert "Completing your Plex Media Server libraries" in result.stderr
+
+    def test_csv_format_stdout_is_only_csv(self, config_env: Path) -> None:
+        """--format csv stdout starts with the header row; status text is on stderr."""
+        plex, tmdb = _movie_scan_mocks()
+        runner = CliRunner()
+
+        with (
+            patch("complexionist.plex.PlexClient", return_value=plex),
+            patch("complexionist.tmdb.TMDBClient", return_value=tmdb),
+        ):
+            result = runner.invoke(main, ["movies", "--format", "csv"])
+
+        assert result.exit_code == 0
+        assert result.stdout.startswith(
+            "Collection,Movie Title,Year,TMDB ID,Release Date,TMDB URL\n"
+        )
+        assert "Completing your Plex Media Server libraries" in result.stderr
+
+    def test_csv_format_multiple_libraries_is_machine_readable(self, config_env: Path) -> None:
+        """Per-library headers stay off stdout, so the first CSV row is the header."""
+        plex, tmdb = _movie_scan_mocks()
+        plex.get_movie_libraries.return_value = [
+            MagicMock(title="Movies", type="movie", locations=["/movies"]),
+            MagicMock(title="4K Movies", type="movie", locations=["/movies4k"]),
+        ]
+        runner = CliRunner()
+
+        with (
+            patch("complexionist.plex.PlexClient", return_value=plex),
+            patch("complexionist.tmdb.TMDBClient", return_value=tmdb),
+        ):
+            result = runner.invoke(
+                main, ["movies", "-l", "Movies", "-l", "4K Movies", "--format", "csv"]
+            )
+
+        assert result.exit_code == 0
+        rows = list(csv.reader(io.StringIO(result.stdout)))
+        assert rows[0] == [
+            "Collection",
+            "Movie Title",
+            "Year",
+            "TMDB ID",
+            "Release Date",
+            "TMDB URL",
+        ]
+        assert "Scanning library: 4K Movies" in result.stderr
+
+    def test_machine_format_library_listing_goes_to_stderr(self, config_env: Path) -> None:
+        """An unknown --library lists the libraries on stderr, leaving stdout empty."""
+        plex, _ = _movie_scan_mocks()
+        runner = CliRunner()
+
+        with patch("complexionist.plex.PlexClient", return_value=plex):
+            result = runner.invoke(main, ["movies", "-l", "Nope", "--format", "json"])
+
+        assert result.exit_code == 0
+        assert result.stdout == ""
+        assert "Available movie libraries" in result.stderr
+
+    def test_machine_formats_disable_progress(self, config_env: Path) -> None:
+        """--format json/csv scans without a progress bar on stdout."""
+        import complexionist.cli as cli_module
+
+        plex, tmdb = _movie_scan_mocks()
+        runner = CliRunner()
+
+        with (
+            patch("complexionist.plex.PlexClient", return_value=plex),
+            patch("complexionist.tmdb.TMDBClient", return_value=tmdb),
+            patch.object(
+                cli_module, "_scan_progress", wraps=cli_module._scan_progress
+            ) as scan_progress,
+        ):
+            result = runner.invoke(main, ["movies", "--format", "json"])
+
+        assert result.exit_code == 0
+        scan_progress.assert_called_once_with(True)
+
     def test_csv_format(self, config_env: Path) -> None:
         """--format csv emits CSV rows to stdout."""
         plex, tmdb = _movie_scan_mocks()
@@ -258,8 +444,8 @@ class TestMoviesCommand:
 
         assert result.exit_code == 0
         assert "Collection,Movie Title,Year,TMDB ID" in result.output
-        # Rich wraps long CSV rows at the console width; join lines before matching
-        assert "Missing Movie" in result.output.replace("\n", "")
+        # CSV bypasses Rich, so rows are written unwrapped
+        assert "Missing Movie" in result.output
 
     def test_include_future_passed_to_finder(self, config_env: Path) -> None:
         """--include-future is forwarded to MovieGapFinder."""
@@ -284,6 +470,78 @@ class TestMoviesCommand:
         assert result.exit_code == 0
         assert finder_cls.call_args.kwargs["include_future"] is True
 
+    @pytest.mark.parametrize(("args", "expected"), [([], 2), (["--min-owned", "5"], 5)])
+    def test_min_owned_from_config_or_flag(
+        self, config_env: Path, args: list[str], expected: int
+    ) -> None:
+        """--min-owned overrides the config value, which applies otherwise."""
+        plex, _ = _movie_scan_mocks()
+        finder_cls = MagicMock()
+        finder_cls.return_value.find_gaps.return_value = MovieGapReport(
+            library_name="Movies",
+            total_movies_scanned=0,
+            movies_with_tmdb_id=0,
+            movies_in_collections=0,
+            unique_collections=0,
+        )
+        runner = CliRunner()
+
+        with (
+            patch("complexionist.plex.PlexClient", return_value=plex),
+            patch("complexionist.tmdb.TMDBClient", return_value=MagicMock()),
+            patch("complexionist.gaps.MovieGapFinder", finder_cls),
+        ):
+            result = runner.invoke(main, ["movies", *args])
+
+        assert result.exit_code == 0
+        assert finder_cls.call_args.kwargs["min_owned"] == expected
+
+    def test_unknown_libraries_all_reported(self, config_env: Path) -> None:
+        """Every unknown --library name is reported before listing libraries."""
+        plex, _ = _movie_scan_mocks()
+        runner = CliRunner()
+
+        with patch("complexionist.plex.PlexClient", return_value=plex):
+            result = runner.invoke(main, ["movies", "-l", "Nope", "-l", "Movies", "-l", "Gone"])
+
+        assert result.exit_code == 0
+        assert "Library not found: Nope" in result.stderr
+        assert "Library not found: Gone" in result.stderr
+        assert "Available movie libraries" in result.stdout
+
+    def test_option_defaults_come_from_config_written_at_first_run(
+        self, no_config_env: Path
+    ) -> None:
+        """Config-backed defaults are read after the first-run check, not at parse time."""
+
+        def run_wizard() -> None:
+            ini = VALID_INI + "\n[options]\nmin_owned = 7\nmin_collection_size = 4\n"
+            (no_config_env / "complexionist.ini").write_text(ini, encoding="utf-8")
+            reset_config()
+
+        plex, _ = _movie_scan_mocks()
+        finder_cls = MagicMock()
+        finder_cls.return_value.find_gaps.return_value = MovieGapReport(
+            library_name="Movies",
+            total_movies_scanned=0,
+            movies_with_tmdb_id=0,
+            movies_in_collections=0,
+            unique_collections=0,
+        )
+        runner = CliRunner()
+
+        with (
+            patch("complexionist.cli._check_config_exists", side_effect=run_wizard),
+            patch("complexionist.plex.PlexClient", return_value=plex),
+            patch("complexionist.tmdb.TMDBClient", return_value=MagicMock()),
+            patch("complexionist.gaps.MovieGapFinder", finder_cls),
+        ):
+            result = runner.invoke(main, ["movies"])
+
+        assert result.exit_code == 0, result.output
+        assert finder_cls.call_args.kwargs["min_owned"] == 7
+        assert finder_cls.call_args.kwargs["min_collection_size"] == 4
+
     def test_plex_connection_failure_exits_nonzero(self, config_env: Path) -> None:
         """A Plex connection failure prints an error and exits 1."""
         plex = MagicMock()
@@ -295,6 +553,9 @@ class TestMoviesCommand:
 
         assert result.exit_code == 1
         assert "Plex error" in result.output
+        # Errors go to stderr so piped json/csv output stays clean
+        assert "Plex error" in result.stderr
+        assert "Plex error" not in result.stdout
 
     def test_tmdb_connection_failure_exits_nonzero(self, config_env: Path) -> None:
         """A TMDB connection failure prints an error and exits 1."""
@@ -347,6 +608,23 @@ class TestTVCommand:
         assert "Missing episodes: 1" in result.output
         assert list(config_env.glob("*_tv_gaps_*.csv"))
 
+    def test_tvdb_connection_failure_exits_nonzero(self, config_env: Path) -> None:
+        """A TVDB connection failure prints an error and exits 1."""
+        plex, _ = _tv_scan_mocks()
+        tvdb = MagicMock()
+        tvdb.test_connection.side_effect = TVDBError("Invalid API key")
+        runner = CliRunner()
+
+        with (
+            patch("complexionist.plex.PlexClient", return_value=plex),
+            patch("complexionist.tvdb.TVDBClient", return_value=tvdb),
+        ):
+            result = runner.invoke(main, ["tv"])
+
+        assert result.exit_code == 1
+        assert "TVDB error" in result.stderr
+        assert "Invalid API key" in result.stderr
+
     def test_recent_threshold_zero_passed_to_finder(self, config_env: Path) -> None:
         """--recent-threshold 0 overrides the config default of 24."""
         plex, _ = _tv_scan_mocks()
@@ -461,6 +739,27 @@ class TestScanCommand:
         assert movie_finder_cls.call_args.kwargs["include_future"] is True
         assert tv_finder_cls.call_args.kwargs["include_future"] is True
 
+    def test_scan_connects_to_plex_once(self, config_env: Path) -> None:
+        """Both halves of scan share a single Plex connection."""
+        plex = self._mock_plex_dual()
+        plex_cls = MagicMock(return_value=plex)
+        runner = CliRunner()
+
+        with (
+            patch("complexionist.plex.PlexClient", plex_cls),
+            patch("complexionist.tmdb.TMDBClient", return_value=MagicMock()),
+            patch("complexionist.tvdb.TVDBClient", return_value=MagicMock()),
+            patch("complexionist.gaps.MovieGapFinder", MagicMock()),
+            patch("complexionist.gaps.EpisodeGapFinder", MagicMock()),
+            patch("complexionist.output.MovieReportFormatter", MagicMock()),
+            patch("complexionist.output.TVReportFormatter", MagicMock()),
+        ):
+            result = runner.invoke(main, ["scan"])
+
+        assert result.exit_code == 0
+        assert plex_cls.call_count == 1
+        assert plex.connect.call_count == 1
+
 
 class TestCacheCommands:
     """Tests for cache subcommands."""
@@ -507,3 +806,76 @@ class TestConfigShowCommand:
         assert "test-token-12345" not in result.output
         assert "Token: (set)" in result.output
         assert "Recent threshold: 24 hours" in result.output
+
+
+class TestFirstRunDetection:
+    """detect_first_run reuses an already-loaded config path."""
+
+    def test_loaded_config_skips_path_walk(self, config_env: Path) -> None:
+        from complexionist.config import get_config
+        from complexionist.setup import detect_first_run
+
+        get_config()
+        with patch("complexionist.setup.find_config_file") as find:
+            assert detect_first_run() is False
+        find.assert_not_called()
+
+    def test_no_config_is_first_run(self, no_config_env: Path) -> None:
+        from complexionist.setup import detect_first_run
+
+        assert detect_first_run() is True
+
+
+def test_select_library_accepts_name_after_retry(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Library names match case-insensitively, including after a bad entry."""
+    from complexionist import cli
+
+    answers = iter(["nope", "anime"])
+    monkeypatch.setattr(cli.Prompt, "ask", lambda *args, **kwargs: next(answers))
+    libraries = [MagicMock(title="TV Shows"), MagicMock(title="Anime")]
+
+    assert cli._select_library_interactive(libraries, "TV") == "Anime"
+
+
+def test_save_example_ini_writes_atomically(tmp_path: Path) -> None:
+    """The example INI is written in full and no temp file is left behind."""
+    from complexionist.cli import _save_example_ini
+
+    path = tmp_path / "complexionist.ini.example"
+    _save_example_ini(path)
+
+    assert "[plex:0]" in path.read_text(encoding="utf-8")
+    assert list(tmp_path.iterdir()) == [path]
+
+
+class TestScanProgress:
+    """Tests for the _scan_progress helper."""
+
+    def test_quiet_yields_no_callback(self) -> None:
+        with _scan_progress(quiet=True) as callback:
+            assert callback is None
+
+    def test_not_a_terminal_yields_no_callback(self) -> None:
+        with (
+            patch.object(Console, "is_terminal", new_callable=PropertyMock, return_value=False),
+            _scan_progress(quiet=False) as callback,
+        ):
+            assert callback is None
+
+    def test_bursts_are_coalesced(self) -> None:
+        with (
+            patch.object(Console, "is_terminal", new_callable=PropertyMock, return_value=True),
+            patch("rich.progress.Progress.update") as update,
+            _scan_progress(quiet=False) as callback,
+        ):
+            assert callback is not None
+            for i in range(1, 101):
+                callback("Fetching movies", i, 100)
+            callback("Checking collections", 1, 10)
+
+        calls = update.call_args_list
+        # First tick, the final tick and the stage change always get through
+        assert calls[0].kwargs["completed"] == 1
+        assert any(c.kwargs["completed"] == 100 for c in calls)
+        assert calls[-1].kwargs["description"] == "Checking collections"
+        assert len(calls) < 101
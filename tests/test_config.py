@@ -16,7 +16,10 @@ from complexionist.config import (
     TMDBConfig,
     TVDBConfig,
     _expand_env_vars,
+    _parse_int_list,
+    get_config,
     get_config_paths,
+    has_valid_config,
     load_config,
     reset_config,
     save_default_config,
@@ -109,6 +112,34 @@ class TestEnvVarExpansion:
         finally:
             del os.environ["TEST_VAR"]
 
+    def test_unchanged_containers_are_not_copied(self) -> None:
+        """Sections with no references come back as the same objects."""
+        os.environ["TEST_VAR"] = "test_value"
+        try:
+            static = {"url": "http://localhost", "servers": [{"name": "a"}]}
+            raw = {"plex": static, "tmdb": {"api_key": "${TEST_VAR}"}}
+            result = _expand_env_vars(raw)
+            assert result == {"plex": static, "tmdb": {"api_key": "test_value"}}
+            assert result["plex"] is static
+            assert raw["tmdb"]["api_key"] == "${TEST_VAR}"  # input is not mutated
+        finally:
+            del os.environ["TEST_VAR"]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("1,2,3", [1, 2, 3]),
+        (" 10 , 20 ,30 ", [10, 20, 30]),
+        ("1,,2,", [1, 2]),
+        ("1, abc, 3", [1, 3]),
+        ("   ", []),
+    ],
+)
+def test_parse_int_list(value: str, expected: list[int]) -> None:
+    """Clean lists take the fast path; empty or invalid items are skipped."""
+    assert _parse_int_list(value) == expected
+
 
 class TestConfigLoading:
     """Tests for configuration loading."""
@@ -208,6 +239,19 @@ options:
 
         assert "config.yaml" in str(exc_info.value)
 
+    @pytest.mark.skipif(not _HAS_YAML, reason="PyYAML not installed")
+    def test_load_yaml_non_ascii(self, tmp_path: Path) -> None:
+        """YAML files are read as bytes; UTF-8 text still decodes correctly."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(
+            'exclusions:\n  shows:\n    - "Les Misérables"\n',
+            encoding="utf-8",
+        )
+
+        reset_config()
+        cfg = load_config(config_path)
+        assert cfg.exclusions.shows == ["Les Misérables"]
+
     def test_load_ini_config(self) -> None:
         """Test loading configuration from INI file."""
         config_content = """
@@ -256,6 +300,20 @@ collections = Anthology
         finally:
             temp_path.unlink()
 
+    def test_load_ini_values_are_not_interpolated(self, tmp_path: Path) -> None:
+        """A '%' in a value (e.g. a URL-encoded token or path) is read verbatim."""
+        config_path = tmp_path / "complexionist.ini"
+        config_path.write_text(
+            "[plex:0]\nurl = http://localhost:32400\ntoken = abc%2Fdef\n\n"
+            "[paths]\nplex_prefix = /media/100%\n",
+            encoding="utf-8",
+        )
+
+        reset_config()
+        cfg = load_config(config_path)
+        assert cfg.plex.token == "abc%2Fdef"
+        assert cfg.paths.plex_prefix == "/media/100%"
+
     def test_load_ini_partial_config(self) -> None:
         """Test loading partial INI config uses defaults for missing values."""
         config_content = """
@@ -278,6 +336,41 @@ min_collection_size = 3
         finally:
             temp_path.unlink()
 
+    def test_get_config_parses_file_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """get_config() caches the parsed file until reset_config()."""
+        from unittest.mock import patch
+
+        from complexionist import config as config_module
+
+        (tmp_path / "complexionist.ini").write_text("[options]\nmin_owned = 4\n", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+        reset_config()
+        try:
+            with patch.object(
+                config_module, "_load_ini_config", wraps=config_module._load_ini_config
+            ) as loader:
+                assert get_config().options.min_owned == 4
+                assert get_config().options.min_owned == 4
+                assert has_valid_config() is False  # no credentials
+            assert loader.call_count == 1
+        finally:
+            reset_config()
+
+
+def test_config_import_defers_yaml() -> None:
+    """PyYAML is only imported when a legacy YAML config is actually loaded."""
+    import subprocess
+    import sys
+
+    code = "import sys, complexionist.config; print('yaml' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
+
 
 class TestConfigPaths:
     """Tests for configuration path handling."""
@@ -299,6 +392,21 @@ class TestConfigPaths:
         home = Path.home()
         assert any(str(home) in str(p) for p in paths)
 
+    def test_get_config_paths_follows_cwd_change(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The memoized path list is keyed on cwd, so a chdir is picked up."""
+        first, second = tmp_path / "a", tmp_path / "b"
+        first.mkdir()
+        second.mkdir()
+
+        monkeypatch.chdir(first)
+        assert first / "complexionist.ini" in get_config_paths()
+        monkeypatch.chdir(second)
+        paths = get_config_paths()
+        assert second / "complexionist.ini" in paths
+        assert first / "complexionist.ini" not in paths
+
 
 class TestDefaultConfig:
     """Tests for default config generation."""
@@ -323,6 +431,12 @@ class TestDefaultConfig:
             assert parser.has_section("options")
             assert parser.has_section("exclusions")
 
+    def test_save_default_config_keeps_unc_examples(self, tmp_path: Path) -> None:
+        """The [paths] examples keep their backslashes (no stray escape characters)."""
+        text = save_default_config(tmp_path / "complexionist.ini").read_text(encoding="utf-8")
+        assert "# plex_prefix = \\\\volume1\\video\n" in text
+        assert "\v" not in text
+
     def test_save_default_config_with_values(self) -> None:
         """Test saving config with actual values."""
         import configparser
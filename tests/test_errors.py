@@ -29,7 +29,7 @@ finder._get_collection_ids([movie])
 
 # Exercise the episode finder's TVDB error-logging path
 tvdb = MagicMock()
-tvdb.get_series.side_effect = TVDBError("boom")
+tvdb.get_series_with_episodes.side_effect = TVDBError("boom")
 show = MagicMock()
 show.has_tvdb_id = True
 show.tvdb_id = 1
@@ -117,7 +117,7 @@ def test_episode_finder_log_includes_context(tmp_path: Path, monkeypatch) -> Non
     monkeypatch.setattr(config_mod, "get_exe_directory", lambda: tmp_path)
 
     tvdb = MagicMock()
-    tvdb.get_series.side_effect = TVDBError("boom")
+    tvdb.get_series_with_episodes.side_effect = TVDBError("boom")
     show = MagicMock()
     show.has_tvdb_id = True
     show.tvdb_id = 1
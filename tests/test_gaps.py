@@ -25,18 +25,21 @@ from complexionist.tmdb import TMDBClient, TMDBCollection, TMDBMovie, TMDBMovieD
 from complexionist.tvdb import TVDBEpisode
 
 
-def _wire_real_is_movie_cached(mock_client: MagicMock) -> None:
-    """Route ``is_movie_cached`` through the real TMDBClient implementation.
-
-    On a bare MagicMock, ``is_movie_cached()`` returns a truthy MagicMock —
-    every lookup would silently take the cache-hit path and skip the
-    rate-lock branch (the vacuous-pass problem from review 2026-07
-    finding 33). Delegating to the real method makes the mock honor
-    whatever ``mock_client._cache`` is set to (None or a fake cache).
+def _wire_real_cache_checks(mock_client: MagicMock) -> None:
+    """Route ``is_movie_cached``/``is_collection_cached`` through the real TMDBClient.
+
+    On a bare MagicMock, these return a truthy MagicMock — every lookup
+    would silently take the cache-hit path and skip the rate-lock branch
+    (the vacuous-pass problem from review 2026-07 finding 33). Delegating
+    to the real methods makes the mock honor whatever ``mock_client._cache``
+    is set to (None or a fake cache).
     """
     mock_client.is_movie_cached.side_effect = lambda tmdb_id: TMDBClient.is_movie_cached(
         mock_client, tmdb_id
     )
+    mock_client.is_collection_cached.side_effect = lambda collection_id: (
+        TMDBClient.is_collection_cached(mock_client, collection_id)
+    )
 
 
 class TestGapModels:
@@ -417,7 +420,7 @@ class TestMovieGapFinder:
         # 2026-07 finding 33). Tests that want cache hits assign a
         # _DictCache to mock_client._cache afterwards.
         mock_client._cache = None
-        _wire_real_is_movie_cached(mock_client)
+        _wire_real_cache_checks(mock_client)
 
         def get_movie(movie_id: int) -> TMDBMovieDetails:
             collection_id = movie_collections.get(movie_id)
@@ -868,7 +871,7 @@ class TestMovieGapFinder:
 
         tmdb = MagicMock()
         tmdb._cache = None  # Exercise the rate-lock branch (see helper comment)
-        _wire_real_is_movie_cached(tmdb)
+        _wire_real_cache_checks(tmdb)
         tmdb.get_movie.side_effect = get_movie
         past = date(2020, 1, 1)
         tmdb.get_collection.return_value = TMDBCollection(
@@ -913,7 +916,7 @@ class TestMovieGapFinder:
 
         tmdb = MagicMock()
         tmdb._cache = None  # Exercise the rate-lock branch (see helper comment)
-        _wire_real_is_movie_cached(tmdb)
+        _wire_real_cache_checks(tmdb)
         tmdb.get_movie.side_effect = get_movie
         past = date(2020, 1, 1)
         tmdb.get_collection.return_value = TMDBCollection(
@@ -1016,6 +1019,39 @@ class TestMovieGapFinder:
         # Exactly one throttle sleep: 2 uncached lookups, first one is free
         assert self.sleep_calls == [pytest.approx(0.25)]
 
+    def test_collection_fetches_are_throttled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Uncached collection fetches share the same throttle as movie lookups."""
+        monkeypatch.setattr("complexionist.gaps.movies.time.monotonic", lambda: 100.0)
+
+        movies = [
+            PlexMovie(rating_key=str(i), title=f"Movie {i}", tmdb_id=100 + i) for i in range(6)
+        ]
+        plex = self._create_mock_plex_client(movies)
+
+        # Two owned movies in each of collections 1, 2 and 3
+        movie_collections = {100 + i: 1 + i // 2 for i in range(6)}
+        collections = {
+            cid: TMDBCollection(
+                id=cid,
+                name=f"Collection {cid}",
+                parts=[
+                    TMDBMovie(id=100 + 2 * (cid - 1), title="A", release_date=date(2020, 1, 1)),
+                    TMDBMovie(id=101 + 2 * (cid - 1), title="B", release_date=date(2020, 1, 1)),
+                    TMDBMovie(id=900 + cid, title="Missing", release_date=date(2020, 1, 1)),
+                ],
+            )
+            for cid in (1, 2, 3)
+        }
+        tmdb = self._create_mock_tmdb_client(movie_collections, collections)
+        # Movie lookups are cached; the three collections are not
+        tmdb._cache = _DictCache({100 + i for i in range(6)})
+
+        report = MovieGapFinder(plex, tmdb).find_gaps()
+
+        assert sorted(g.collection_id for g in report.collections_with_gaps) == [1, 2, 3]
+        # 3 uncached collection fetches, first one is free
+        assert self.sleep_calls == [pytest.approx(0.25)] * 2
+
 
 # ============================================================================
 # Episode Gap Detection Tests
@@ -1217,6 +1253,16 @@ class TestMultiEpisodeParsing:
         assert (2, 1) in result
         assert (2, 2) in result
 
+    def test_parse_multi_episode_three_consecutive_e(self) -> None:
+        """Test parsing S02E01E02E03 format covers the whole run."""
+        result = parse_multi_episode_filename("Show.S02E01E02E03.720p.mkv")
+        assert sorted(result) == [(2, 1), (2, 2), (2, 3)]
+
+    def test_parse_multi_episode_uses_first_e_when_last_implausible(self) -> None:
+        """An implausible last E number still leaves the first pair as a range."""
+        result = parse_multi_episode_filename("Show.S01E03E05E99.mkv")
+        assert sorted(result) == [(1, 3), (1, 4), (1, 5)]
+
     def test_parse_multi_episode_none_path(self) -> None:
         """Test parsing None file path."""
         result = parse_multi_episode_filename(None)
@@ -1297,19 +1343,16 @@ class TestEpisodeGapFinder:
         """Create a mock TVDB client."""
         mock_client = MagicMock()
 
-        def get_series_episodes(
-            series_id: int, series_status: str | None = None
-        ) -> list[TVDBEpisode]:
-            return episodes_by_series.get(series_id, [])
-
-        mock_client.get_series_episodes.side_effect = get_series_episodes
-        mock_client.test_connection.return_value = True
-
-        # Mock get_series to return an object with image and status attributes
+        # Series object with image and status attributes
         mock_series = MagicMock()
         mock_series.image = "https://example.com/poster.jpg"
         mock_series.status = "Continuing"
-        mock_client.get_series.return_value = mock_series
+
+        def get_series_with_episodes(series_id: int) -> tuple[MagicMock, list[TVDBEpisode]]:
+            return mock_series, episodes_by_series.get(series_id, [])
+
+        mock_client.get_series_with_episodes.side_effect = get_series_with_episodes
+        mock_client.test_connection.return_value = True
 
         return mock_client
 
@@ -1714,6 +1757,41 @@ class TestEpisodeGapFinder:
         assert len(report.shows_with_gaps) == 1
         assert report.shows_with_gaps[0].missing_count == 1
 
+    def test_find_gaps_many_shows_keeps_show_order(self) -> None:
+        """TVDB lookups run concurrently but results line up with their shows."""
+        shows = [PlexShow(rating_key=str(i), title=f"Show {i}", tvdb_id=100 + i) for i in range(10)]
+        # Show i owns episode 1 only; TVDB lists i + 2 episodes -> i + 1 missing
+        plex_episodes = {
+            str(i): [
+                PlexEpisode(rating_key=f"e{i}", title="Ep 1", season_number=1, episode_number=1)
+            ]
+            for i in range(10)
+        }
+        plex = self._create_mock_plex_client(shows, plex_episodes)
+
+        tvdb_episodes = {
+            100 + i: [
+                TVDBEpisode(
+                    id=n,
+                    seriesId=100 + i,
+                    seasonNumber=1,
+                    number=n,
+                    name=f"Ep {n}",
+                    aired=date(2020, 1, n),
+                )
+                for n in range(1, i + 3)
+            ]
+            for i in range(10)
+        }
+        tvdb = self._create_mock_tvdb_client(tvdb_episodes)
+
+        report = EpisodeGapFinder(plex, tvdb).find_gaps()
+
+        assert report.total_episodes_owned == 10
+        assert [(g.show_title, g.missing_count) for g in report.shows_with_gaps] == [
+            (f"Show {i}", i + 1) for i in reversed(range(10))
+        ]
+
 
 class TestSkippedItemTracking:
     """Per-item error paths increment ScanStatistics.items_skipped (finding 7)."""
@@ -1735,7 +1813,7 @@ class TestSkippedItemTracking:
 
         tmdb = MagicMock()
         tmdb._cache = None
-        _wire_real_is_movie_cached(tmdb)
+        _wire_real_cache_checks(tmdb)
         tmdb.get_movie.side_effect = TMDBError("boom")
 
         monkeypatch.setattr("complexionist.gaps.movies.time.sleep", lambda s: None)
@@ -1760,7 +1838,7 @@ class TestSkippedItemTracking:
         plex.get_episodes.return_value = []
 
         tvdb = MagicMock()
-        tvdb.get_series.side_effect = TVDBError("boom")
+        tvdb.get_series_with_episodes.side_effect = TVDBError("boom")
 
         stats = ScanStatistics()
         stats.start()
@@ -1771,3 +1849,39 @@ class TestSkippedItemTracking:
             ScanStatistics.reset_current()
 
         assert stats.items_skipped == 1
+
+    def test_plex_episode_error_skips_only_that_show(self) -> None:
+        from complexionist.plex import PlexError
+        from complexionist.statistics import ScanStatistics
+
+        plex = MagicMock()
+        plex.get_shows.return_value = [
+            PlexShow(rating_key="1", title="Broken", tvdb_id=500),
+            PlexShow(rating_key="2", title="Fine", tvdb_id=501),
+        ]
+        plex.get_tv_libraries.return_value = [MagicMock(title="TV Shows")]
+
+        def get_episodes(rating_key: str) -> list[PlexEpisode]:
+            if rating_key == "1":
+                raise PlexError("boom")
+            return []
+
+        plex.get_episodes.side_effect = get_episodes
+
+        series = MagicMock(image=None, status="Ended")
+        tvdb = MagicMock()
+        tvdb.get_series_with_episodes.return_value = (
+            series,
+            [TVDBEpisode(id=1, seriesId=501, seasonNumber=1, number=1, aired=date(2020, 1, 1))],
+        )
+
+        stats = ScanStatistics()
+        stats.start()
+        try:
+            report = EpisodeGapFinder(plex, tvdb).find_gaps()
+        finally:
+            stats.stop()
+            ScanStatistics.reset_current()
+
+        assert stats.items_skipped == 1
+        assert [g.show_title for g in report.shows_with_gaps] == ["Fine"]
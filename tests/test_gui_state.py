@@ -288,6 +288,25 @@ class TestLibrarySelectionPersistence:
         assert "[libraries]" in content
         assert "movie_library = Movies" in content
 
+    def test_percent_in_library_name_round_trips(self, tmp_path: Path, monkeypatch) -> None:
+        """A '%' in a saved library name is read back verbatim, not interpolated."""
+        from complexionist.config import reset_config
+        from complexionist.gui.library_state import (
+            LibrarySelection,
+            load_library_selection,
+            save_library_selection,
+        )
+
+        (tmp_path / "complexionist.ini").write_text("[plex:0]\nname = Test\n", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+        reset_config()
+        try:
+            sel = LibrarySelection(movie_library="100% Movies", tv_library="TV", active_server=0)
+            assert save_library_selection(sel)
+            assert load_library_selection() == sel
+        finally:
+            reset_config()
+
     def test_save_skips_write_when_unchanged(self, tmp_path: Path, monkeypatch) -> None:
         """An unchanged selection performs no file write at all (finding 13)."""
         import complexionist.config as config_mod
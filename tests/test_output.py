@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 import json
 from datetime import date
 
@@ -313,3 +314,83 @@ class TestSkippedWarning:
 
         out = capsys.readouterr().out
         assert "could not be checked" not in out
+
+
+class TestWriteCSV:
+    """Tests for streaming CSV output via write_csv()."""
+
+    def test_write_csv_matches_to_csv(self) -> None:
+        formatter = MovieReportFormatter(_make_movie_report())
+        stream = io.StringIO()
+        formatter.write_csv(stream)
+        assert stream.getvalue() == formatter.to_csv()
+
+    def test_markup_in_titles_is_not_interpreted(self) -> None:
+        report = _make_movie_report()
+        report.collections_with_gaps[0].missing_movies[0].title = "[red]Alert[/red]"
+        stream = io.StringIO()
+        MovieReportFormatter(report).write_csv(stream, lineterminator="\n")
+        assert "[red]Alert[/red]" in stream.getvalue()
+        assert "\r" not in stream.getvalue()
+
+
+class TestMovieReportText:
+    """Tests for MovieReportFormatter.to_text()."""
+
+    def test_lists_missing_movies(self, capsys) -> None:
+        MovieReportFormatter(_make_movie_report()).to_text()
+        out = capsys.readouterr().out
+        assert "  - Harry Potter and the Goblet of Fire (2005)" in out
+        assert "  - Alien Resurrection (1997)" in out
+
+    def test_truncates_unless_verbose(self, capsys) -> None:
+        report = _make_movie_report()
+        gap = report.collections_with_gaps[0]
+        gap.missing_movies = [
+            MissingMovie(tmdb_id=i, title=f"Movie {i}", year=2000 + i) for i in range(8)
+        ]
+        MovieReportFormatter(report).to_text()
+        out = capsys.readouterr().out
+        assert "Movie 4 (2004)" in out
+        assert "Movie 5" not in out
+        assert "... and 3 more" in out
+
+        MovieReportFormatter(report).to_text(verbose=True)
+        assert "Movie 7 (2007)" in capsys.readouterr().out
+
+    def test_markup_in_titles_is_escaped(self, capsys) -> None:
+        report = _make_movie_report()
+        report.collections_with_gaps[0].missing_movies[0].title = "Movie [bold]X[/bold]"
+        MovieReportFormatter(report).to_text()
+        assert "Movie [bold]X[/bold]" in capsys.readouterr().out
+
+
+class TestTVReportText:
+    """Tests for TVReportFormatter.to_text()."""
+
+    def test_lists_missing_episodes(self, capsys) -> None:
+        TVReportFormatter(_make_tv_report()).to_text()
+        out = capsys.readouterr().out
+        assert "Breaking Bad" in out
+        assert "Season 5:" in out
+        assert "S05E15 - Granite State" in out
+        assert "S05E16 - Felina" in out
+
+    def test_report_is_printed_in_one_call(self) -> None:
+        from unittest.mock import patch
+
+        with patch("complexionist.output.console") as mock_console:
+            TVReportFormatter(_make_tv_report()).to_text()
+        assert mock_console.print.call_count == 1
+
+
+class TestJSONEncoder:
+    """Both JSON encoders produce the same document."""
+
+    def test_stdlib_fallback_matches(self, monkeypatch) -> None:
+        import complexionist.output as output_module
+
+        formatter = TVReportFormatter(_make_tv_report())
+        default = json.loads(formatter.to_json())
+        monkeypatch.setattr(output_module, "_HAS_ORJSON", False)
+        assert json.loads(formatter.to_json()) == default
@@ -1,5 +1,7 @@
 """Tests for the Plex client."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -360,3 +362,41 @@ class TestPlexClient:
         assert episodes[1].file_path is None
         assert episodes[1].resolution is None
         assert episodes[1].video_codec is None
+
+    @patch("complexionist.plex.client.PlexServer")
+    def test_get_episodes_uses_a_connection_per_worker_thread(
+        self, mock_server_class: MagicMock
+    ) -> None:
+        """Worker threads never share the main connection's session, or each other's."""
+        servers: list[MagicMock] = []
+
+        def open_server(*args: object, **kwargs: object) -> MagicMock:
+            server = MagicMock()
+            server.fetchItem.return_value.episodes.return_value = []
+            servers.append(server)
+            return server
+
+        mock_server_class.side_effect = open_server
+        users: dict[int, set[int]] = {}
+        barrier = threading.Barrier(4)
+
+        def fetch(rating_key: str) -> None:
+            barrier.wait()  # Make all four workers run at once
+            client.get_episodes(rating_key)
+            server = client._thread_local.server
+            users.setdefault(id(server), set()).add(threading.get_ident())
+
+        client = PlexClient(url="http://localhost:32400", token="test")
+        client.connect()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(fetch, ["1", "2", "3", "4"]))
+
+        # Main connection plus one per worker, none used by two threads
+        assert len(servers) == 5
+        servers[0].fetchItem.assert_not_called()
+        assert len(users) == 4
+        assert all(len(threads) == 1 for threads in users.values())
+
+        client.close()
+        for server in servers:
+            server._session.close.assert_called_once()
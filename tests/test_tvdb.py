@@ -1,11 +1,16 @@
 """Tests for the TVDB client."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
 
+from complexionist.cache import Cache
 from complexionist.tvdb import (
     TVDBAuthError,
     TVDBClient,
@@ -171,6 +176,66 @@ class TestTVDBClient:
             with pytest.raises(TVDBError):
                 client.login()
 
+    def test_concurrent_first_calls_login_once(self) -> None:
+        """Worker threads racing on a fresh client share one login and one client."""
+        login_response = MagicMock()
+        login_response.status_code = 200
+        login_response.json.return_value = {"data": {"token": "test_token"}}
+
+        def slow_post(*args: object, **kwargs: object) -> MagicMock:
+            time.sleep(0.05)  # Widen the window for racing logins
+            return login_response
+
+        login_client = MagicMock()
+        login_client.post.side_effect = slow_post
+        login_client.__enter__ = MagicMock(return_value=login_client)
+        login_client.__exit__ = MagicMock(return_value=False)
+        api_clients: list[MagicMock] = []
+
+        def make_client(**kwargs: object) -> MagicMock:
+            if "base_url" not in kwargs:
+                return login_client
+            api_clients.append(MagicMock())
+            return api_clients[-1]
+
+        client = TVDBClient(api_key="test_key")
+        barrier = threading.Barrier(8)
+
+        def first_call() -> httpx.Client:
+            barrier.wait()
+            return client.client
+
+        with (
+            patch("complexionist.tvdb.client.httpx.Client", side_effect=make_client),
+            ThreadPoolExecutor(max_workers=8) as executor,
+        ):
+            results = list(executor.map(lambda _: first_call(), range(8)))
+
+        login_client.post.assert_called_once()
+        assert len(api_clients) == 1
+        assert all(result is api_clients[0] for result in results)
+
+    def test_client_reauthenticates_after_auth_failure(self) -> None:
+        """A 401 seen by one worker makes the next call log in again, not raise."""
+        login_response = MagicMock()
+        login_response.status_code = 200
+        login_response.json.return_value = {"data": {"token": "fresh_token"}}
+        login_client = MagicMock()
+        login_client.post.return_value = login_response
+        login_client.__enter__ = MagicMock(return_value=login_client)
+        login_client.__exit__ = MagicMock(return_value=False)
+
+        client = TVDBClient(api_key="test_key")
+        client._token = "stale_token"
+        client._client = MagicMock()
+        client._on_auth_failure()
+
+        with patch("complexionist.tvdb.client.httpx.Client", return_value=login_client):
+            assert client.client is login_client
+
+        login_client.post.assert_called_once()
+        assert client._token == "fresh_token"
+
     def test_handle_401_error(self) -> None:
         """Test 401 error handling."""
         client = TVDBClient(api_key="test_key")
@@ -232,6 +297,46 @@ class TestTVDBClient:
         assert episodes[0].episode_number == 1
         assert episodes[1].episode_number == 2
 
+    @patch("complexionist.tvdb.client.httpx.Client")
+    def test_get_series_with_episodes_single_request(
+        self, mock_client_class: MagicMock, tmp_path: Path
+    ) -> None:
+        """Series and episodes come from one extended call and are cached together."""
+        client = TVDBClient(api_key="test_key", cache=Cache(cache_dir=tmp_path))
+        client._token = "test_token"
+
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {
+            "data": {
+                "id": 100,
+                "name": "Test Show",
+                "status": {"name": "Ended"},
+                "image": "https://example.com/poster.jpg",
+                "episodes": [
+                    {"id": 1, "seriesId": 100, "seasonNumber": 1, "number": 1},
+                    {"id": 2, "seriesId": 100, "seasonNumber": 1, "number": 2},
+                ],
+            }
+        }
+        mock_http_client = MagicMock()
+        mock_http_client.get.return_value = response
+        mock_client_class.return_value = mock_http_client
+
+        series, episodes = client.get_series_with_episodes(100)
+
+        assert series.status == "Ended"
+        assert series.image == "https://example.com/poster.jpg"
+        assert [ep.episode_number for ep in episodes] == [1, 2]
+        mock_http_client.get.assert_called_once()
+        assert mock_http_client.get.call_args.args[0] == "/series/100/extended"
+
+        # Both halves are now cached, for this method and the single-purpose ones
+        assert client.get_series_with_episodes(100)[0].name == "Test Show"
+        assert len(client.get_series_episodes(100)) == 2
+        assert client.get_series(100).image == "https://example.com/poster.jpg"
+        mock_http_client.get.assert_called_once()
+
     def test_parse_date_valid(self) -> None:
         """Test parsing valid date string."""
         client = TVDBClient(api_key="test_key")
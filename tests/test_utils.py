@@ -4,7 +4,7 @@ from datetime import date, timedelta
 
 import pytest
 
-from complexionist.utils import is_date_past, retry_with_backoff
+from complexionist.utils import is_date_past, past_date_cutoff, retry_with_backoff
 
 
 class TestIsDatePast:
@@ -34,6 +34,11 @@ class TestIsDatePast:
     def test_distant_past_is_past(self) -> None:
         assert is_date_past(date(2020, 1, 1)) is True
 
+    def test_cutoff_matches_is_date_past(self) -> None:
+        cutoff = past_date_cutoff()
+        assert is_date_past(cutoff) is False
+        assert is_date_past(cutoff - timedelta(days=1)) is True
+
 
 class _RateLimitedError(Exception):
     """Test exception carrying a retry_after hint (like TMDBRateLimitError)."""
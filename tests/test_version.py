@@ -6,6 +6,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 REPO_ROOT = Path(__file__).parent.parent
 
 
@@ -33,3 +35,16 @@ def test_commit_count_is_anchored_to_package_repo(tmp_path: Path) -> None:
     )
     assert result.returncode == 0, result.stderr
     assert result.stdout.strip() == str(_repo_commit_count())
+
+
+def test_no_git_call_outside_a_checkout(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Installed copies without a .git skip the git subprocess entirely."""
+    from complexionist import _version
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("git should not be called")
+
+    monkeypatch.setattr(_version, "__file__", str(tmp_path / "pkg" / "_version.py"))
+    monkeypatch.setattr(_version.subprocess, "run", fail)
+    assert _version._get_commit_count() is None
+    assert _version._in_git_checkout(tmp_path) is False